@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
 import logging
@@ -21,6 +22,8 @@ except ImportError:
 
 import dacite
 import github3.repos
+import requests
+import requests.adapters
 import yaml
 
 import cnudie.retrieve
@@ -28,7 +31,6 @@ import github.pullrequest
 import gitutil
 import oci.auth
 import oci.client
-import ocm.base_component
 import ocm.gardener
 import release_notes.model as rnm
 import release_notes.ocm as rno
@@ -37,6 +39,12 @@ import version
 
 logger = logging.getLogger(__name__)
 
+try:
+    # prefer libyaml-bindings (significantly faster), if available
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
 
 class UpstreamUpdatePolicy(enum.StrEnum):
     STRICTLY_FOLLOW = 'strictly-follow'
@@ -89,8 +97,18 @@ def create_ocm_lookups(
     ocm.ComponentDescriptorLookup,
     ocm.VersionLookup,
 ]:
+    # increase poolsize (defaults: 10) to allow for greater parallelism; connections (and thus
+    # TLS-sessions) are reused across lookups
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+    )
+    session.mount('https://', adapter)
+
     oci_client = oci.client.Client(
         credentials_lookup=oci.auth.docker_credentials_lookup(),
+        session=session,
     )
     ocm_repository_lookup = cnudie.retrieve.ocm_repository_lookup(
         *ocm_repositories,
@@ -119,15 +137,10 @@ def create_diff_in_base_component(
     if not os.path.isfile(path):
         return False
 
-    base_component = ocm.base_component.load_base_component(
-        path=path,
-        absent_ok=False,
-    )
-
     # need to take low-level approach, as we need to avoid adding default attributes from
     # BaseComponent (or dropping extra attributes)
     with open(path) as f:
-        base_component = yaml.safe_load(f)
+        base_component = yaml.load(f, Loader=YamlSafeLoader)
 
     if not 'componentReferences' in base_component:
         logger.info(
@@ -155,7 +168,17 @@ def create_diff_in_base_component(
     cref['version'] = upgrade_vector.whither.version
 
     with open(path, 'w') as f:
-        yaml.safe_dump(base_component, f)
+        # keep layout close to original document (to keep upgrade-diffs small): retain order of
+        # attributes, and avoid line-wrapping of long values
+        yaml.dump(
+            base_component,
+            f,
+            Dumper=YamlSafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            width=10**6,
+            allow_unicode=True,
+        )
 
     return True
 
@@ -199,7 +222,6 @@ def create_diff_using_callback(
 def create_upgrade_pullrequest_diff(
     upgrade_vector: ocm.gardener.UpgradeVector,
     repo_dir: str,
-    release_notes_docs: collections.abc.Iterable[rnm.ReleaseNotesDoc],
     component_descriptor_lookup,
     component_reference_name: str | None=None,
 ) -> bool:
@@ -223,11 +245,6 @@ def create_upgrade_pullrequest_diff(
         logger.info('created upgrade-diff using callback')
         created_diff = True
 
-    rnt.release_notes_docs_into_files(
-        release_notes_docs=release_notes_docs,
-        repo_dir=repo_dir,
-    )
-
     return created_diff
 
 
@@ -267,33 +284,53 @@ def create_upgrade_pullrequest(
     component_reference_name: str | None=None,
 ) -> github.pullrequest.UpgradePullRequest:
     logger.info(f'found {upgrade_vector=}')
-    git_helper = gitutil.GitHelper(
-        repo=repo_dir,
-        git_cfg=gitutil.GitCfg(repo_url=repo_url),
-    )
-    from_component_descriptor = component_descriptor_lookup(
-        upgrade_vector.whence,
-        absent_ok=False,
-    )
-    from_component = from_component_descriptor.component
 
-    to_component_descriptor = component_descriptor_lookup(
-        upgrade_vector.whither,
-        absent_ok=False,
-    )
-    to_component = to_component_descriptor.component
+    # retrieving component-descriptors and release-notes is I/O-bound -> run concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        from_component_descriptor_result = pool.submit(
+            component_descriptor_lookup,
+            upgrade_vector.whence,
+            absent_ok=False,
+        )
+        to_component_descriptor_result = pool.submit(
+            component_descriptor_lookup,
+            upgrade_vector.whither,
+            absent_ok=False,
+        )
+        release_notes_docs_result = pool.submit(
+            retrieve_release_notes,
+            upgrade_vector=upgrade_vector,
+            version_lookup=version_lookup,
+            version_filter=version.is_final,
+            oci_client=oci_client,
+            component_descriptor_lookup=component_descriptor_lookup,
+        )
+
+        git_helper = gitutil.GitHelper(
+            repo=repo_dir,
+            git_cfg=gitutil.GitCfg(repo_url=repo_url),
+        )
 
-    release_notes_docs = retrieve_release_notes(
+        from_component = from_component_descriptor_result.result().component
+        to_component = to_component_descriptor_result.result().component
+        release_notes_docs = release_notes_docs_result.result()
+
+    # only touch worktree after all lookups succeeded (so no partial diff is left behind)
+    create_upgrade_pullrequest_diff(
         upgrade_vector=upgrade_vector,
-        version_lookup=version_lookup,
-        version_filter=version.is_final,
-        oci_client=oci_client,
+        repo_dir=repo_dir,
         component_descriptor_lookup=component_descriptor_lookup,
+        component_reference_name=component_reference_name,
     )
 
     grouped_release_notes_docs = rno.group_release_notes_docs(release_notes_docs)
     logger.info(f'grouped into {len(grouped_release_notes_docs)} release-notes documents')
 
+    rnt.release_notes_docs_into_files(
+        release_notes_docs=grouped_release_notes_docs,
+        repo_dir=repo_dir,
+    )
+
     release_notes_markdown = rno.release_notes_docs_as_markdown(
         release_notes_docs=grouped_release_notes_docs,
         prepend_title=True,
@@ -311,14 +348,6 @@ def create_upgrade_pullrequest(
         bom_diff_markdown=bom_diff_markdown,
     )
 
-    create_upgrade_pullrequest_diff(
-        upgrade_vector=upgrade_vector,
-        repo_dir=repo_dir,
-        release_notes_docs=grouped_release_notes_docs,
-        component_descriptor_lookup=component_descriptor_lookup,
-        component_reference_name=component_reference_name,
-    )
-
     fv = upgrade_vector.whence.version
     tv = upgrade_vector.whither.version
     commit_message = f'Upgrade {upgrade_vector.component_name}\n\nfrom {fv} to {tv}'
@@ -368,6 +397,83 @@ def upgrade_pullrequest_exists(
     return False
 
 
+def find_upgrade_vectors(
+    cref: ocm.ComponentReference,
+    version_lookup: ocm.VersionLookup,
+    upstream_component_descriptor: ocm.ComponentDescriptor | None=None,
+    upstream_update_policy: UpstreamUpdatePolicy = UpstreamUpdatePolicy.STRICTLY_FOLLOW,
+    ignore_prerelease_versions: bool=True,
+) -> list[ocm.gardener.UpgradeVector]:
+    if not upstream_component_descriptor:
+        upgrade_vector = ocm.gardener.find_upgrade_vector(
+            component_id=cref.component_id,
+            version_lookup=version_lookup,
+            ignore_prerelease_versions=ignore_prerelease_versions,
+            ignore_invalid_semver_versions=True,
+        )
+
+        if not upgrade_vector:
+            logger.info(f'did not find an upgrade-proposal for {cref=}')
+            return []
+
+        return [upgrade_vector]
+
+    upstream_target_version = None
+    for uref in upstream_component_descriptor.component.componentReferences or ():
+        if uref.componentName == cref.componentName:
+            upstream_target_version = uref.version
+            break
+    else:
+        logger.info(f'upstream has no reference for {cref.componentName}')
+        return []
+
+    if upstream_update_policy  is UpstreamUpdatePolicy.STRICTLY_FOLLOW:
+        candidates = (upstream_target_version,)
+    elif upstream_update_policy is UpstreamUpdatePolicy.ACCEPT_HOTFIXES:
+        cref_versions = version_lookup(cref.componentName)
+        hotfix = version.greatest_version_with_matching_minor(
+            reference_version=cref.version,
+            versions=cref_versions,
+            ignore_prerelease_versions=ignore_prerelease_versions,
+        )
+        if hotfix and hotfix != upstream_target_version:
+            candidates = (hotfix, upstream_target_version)
+        else:
+            candidates = (upstream_target_version,)
+    else:
+        raise ValueError(f'unknown {upstream_update_policy=}')
+
+    upgrade_vectors = []
+    for target in candidates:
+        tv = version.parse_to_semver(target)
+        cv = version.parse_to_semver(cref.version)
+
+        if tv == cv:
+            logger.info(f'already at target {cref.componentName} {target=} (skip)')
+            continue
+
+        if tv < cv:
+            logger.info(
+                f'skip (no downgrades): {cref.componentName} '
+                f'{cref.version=} -> {target=}'
+            )
+            continue
+        upgrade_vectors.append(
+            ocm.gardener.UpgradeVector(
+                whence=ocm.ComponentIdentity(
+                    name=cref.componentName,
+                    version=cref.version
+                ),
+                whither=ocm.ComponentIdentity(
+                    name=cref.componentName,
+                    version=target
+                ),
+            )
+        )
+
+    return upgrade_vectors
+
+
 def create_upgrade_pullrequests(
     component: ocm.Component,
     component_descriptor_lookup: ocm.ComponentDescriptorLookup,
@@ -386,132 +492,91 @@ def create_upgrade_pullrequests(
     upstream_update_policy: UpstreamUpdatePolicy = UpstreamUpdatePolicy.STRICTLY_FOLLOW,
     ignore_prerelease_versions: bool=True,
 ) -> collections.abc.Iterable[github.pullrequest.UpgradePullRequest]:
-    for cref in ocm.gardener.iter_greatest_component_references(
-        references=ocm.gardener.iter_component_references(component=component),
-    ):
-        logger.info(f'processing {cref=}')
-        upgrade_vectors: list[ocm.gardener.UpgradeVector] = []
-
-        for merge_policy_config in merge_policy_configs:
-            if merge_policy_config.matches(cref.componentName):
-                current_merge_policy = merge_policy_config.merge_policy
-                current_merge_method = merge_policy_config.merge_method
-                break
-        else:
-            current_merge_policy = merge_policy
-            current_merge_method = merge_method
-
-        if upstream_component_name:
-            upstream_version = version.greatest_version(
-                versions=version_lookup(upstream_component_name),
-                ignore_prerelease_versions=ignore_prerelease_versions
-            )
+    if upstream_component_name:
+        # upstream-component is the same for all component-references -> only lookup once
+        upstream_version = version.greatest_version(
+            versions=version_lookup(upstream_component_name),
+            ignore_prerelease_versions=ignore_prerelease_versions
+        )
 
-            if not upstream_version:
-                logger.warning(f'no versions for upstream {upstream_component_name=}')
-                continue
+        if not upstream_version:
+            logger.warning(f'no versions for upstream {upstream_component_name=}')
+            return
 
-            upstream_cd: ocm.ComponentDescriptor = component_descriptor_lookup(
-                ocm.ComponentIdentity(
-                    name=upstream_component_name,
-                    version=upstream_version,
-                )
+        upstream_component_descriptor: ocm.ComponentDescriptor = component_descriptor_lookup(
+            ocm.ComponentIdentity(
+                name=upstream_component_name,
+                version=upstream_version,
             )
-            upstream_target_version = None
-            for uref in upstream_cd.component.componentReferences or ():
-                if uref.componentName == cref.componentName:
-                    upstream_target_version = uref.version
-                    break
-            else:
-                logger.info(f'upstream has no reference for {cref.componentName}')
-                continue
-
-            if upstream_update_policy  is UpstreamUpdatePolicy.STRICTLY_FOLLOW:
-                candidates = (upstream_target_version,)
-            elif upstream_update_policy is UpstreamUpdatePolicy.ACCEPT_HOTFIXES:
-                cref_versions = version_lookup(cref.componentName)
-                hotfix = version.greatest_version_with_matching_minor(
-                    reference_version=cref.version,
-                    versions=cref_versions,
-                    ignore_prerelease_versions=ignore_prerelease_versions,
-                )
-                if hotfix and hotfix != upstream_target_version:
-                    candidates = (hotfix, upstream_target_version)
-                else:
-                    candidates = (upstream_target_version,)
-            else:
-                raise ValueError(f'unknown {upstream_update_policy=}')
-
-            for target in candidates:
-                tv = version.parse_to_semver(target)
-                cv = version.parse_to_semver(cref.version)
+        )
+    else:
+        upstream_component_descriptor = None
 
-                if tv == cv:
-                    logger.info(f'already at target {cref.componentName} {target=} (skip)')
-                    continue
+    crefs = list(ocm.gardener.iter_greatest_component_references(
+        references=ocm.gardener.iter_component_references(component=component),
+    ))
 
-                if tv < cv:
-                    logger.info(
-                        f'skip (no downgrades): {cref.componentName} '
-                        f'{cref.version=} -> {target=}'
-                    )
-                    continue
-                upgrade_vectors.append(
-                    ocm.gardener.UpgradeVector(
-                        whence=ocm.ComponentIdentity(
-                            name=cref.componentName,
-                            version=cref.version
-                        ),
-                        whither=ocm.ComponentIdentity(
-                            name=cref.componentName,
-                            version=target
-                        ),
-                    )
-                )
-        else:
-            upgrade_vector = ocm.gardener.find_upgrade_vector(
-                component_id=cref.component_id,
+    # determining upgrade-vectors is I/O-bound (version-lookups), and does not involve any
+    # git-operations -> do so concurrently; creation of pullrequests (which involves modifying
+    # worktree) is still done sequentially
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        upgrade_vectors_per_cref = pool.map(
+            lambda cref: find_upgrade_vectors(
+                cref=cref,
                 version_lookup=version_lookup,
+                upstream_component_descriptor=upstream_component_descriptor,
+                upstream_update_policy=upstream_update_policy,
                 ignore_prerelease_versions=ignore_prerelease_versions,
-                ignore_invalid_semver_versions=True,
-            )
-
-            if not upgrade_vector:
-                logger.info(f'did not find an upgrade-proposal for {cref=}')
-                continue
-
-            upgrade_vectors.append(upgrade_vector)
+            ),
+            crefs,
+        )
 
-        component_reference_name = None
-        if pr_naming_pattern == 'reference-name':
-            component_reference_name = cref.name
+        for cref, upgrade_vectors in zip(crefs, upgrade_vectors_per_cref):
+            logger.info(f'processing {cref=}')
 
-        for uv in upgrade_vectors:
-            if upgrade_pullrequest_exists(
-                upgrade_vector=uv,
-                upgrade_pullrequests=upgrade_pullrequests,
-                component_reference_name=component_reference_name
-            ):
-                logger.info(f'upgrade-pullrequest for {uv=} already exists (skipping)')
-                continue
+            for merge_policy_config in merge_policy_configs:
+                if merge_policy_config.matches(cref.componentName):
+                    current_merge_policy = merge_policy_config.merge_policy
+                    current_merge_method = merge_policy_config.merge_method
+                    break
+            else:
+                current_merge_policy = merge_policy
+                current_merge_method = merge_method
+
+            component_reference_name = None
+            if pr_naming_pattern == 'reference-name':
+                component_reference_name = cref.name
+
+            for uv in upgrade_vectors:
+                if upgrade_pullrequest_exists(
+                    upgrade_vector=uv,
+                    upgrade_pullrequests=upgrade_pullrequests,
+                    component_reference_name=component_reference_name
+                ):
+                    logger.info(f'upgrade-pullrequest for {uv=} already exists (skipping)')
+                    continue
 
-            yield create_upgrade_pullrequest(
-                upgrade_vector=uv,
-                component_descriptor_lookup=component_descriptor_lookup,
-                version_lookup=version_lookup,
-                repo_dir=repo_dir,
-                repo_url=repo_url,
-                repository=repository,
-                merge_policy=current_merge_policy,
-                merge_method=current_merge_method,
-                branch=branch,
-                oci_client=oci_client,
-                component_reference_name=component_reference_name,
-            )
-            # early-exit after first created upgrade PR as a workaround (for now) to prevent
-            # unintended sideeffects (e.g. dirty worktree, git conflicts)
-            # -> possible upgrade PRs for other components will be created upon the next execution
-            return
+                # no need to wait for upgrade-vectors of remaining component-references (see below)
+                pool.shutdown(wait=False, cancel_futures=True)
+
+                yield create_upgrade_pullrequest(
+                    upgrade_vector=uv,
+                    component_descriptor_lookup=component_descriptor_lookup,
+                    version_lookup=version_lookup,
+                    repo_dir=repo_dir,
+                    repo_url=repo_url,
+                    repository=repository,
+                    merge_policy=current_merge_policy,
+                    merge_method=current_merge_method,
+                    branch=branch,
+                    oci_client=oci_client,
+                    component_reference_name=component_reference_name,
+                )
+                # early-exit after first created upgrade PR as a workaround (for now) to prevent
+                # unintended sideeffects (e.g. dirty worktree, git conflicts)
+                # -> possible upgrade PRs for other components will be created upon the next
+                # execution
+                return
 
 
 def main():
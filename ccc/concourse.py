@@ -4,6 +4,7 @@
 
 import ensure
 import functools
+import threading
 
 import ci.log
 import ci.util
@@ -56,7 +57,9 @@ def client_from_parameters(
     return concourse_api
 
 
-@functools.lru_cache()
+_client_lock = threading.Lock()
+
+
 @ensure.ensure_annotations
 def client_from_cfg_name(
     concourse_cfg_name: str,
@@ -70,7 +73,25 @@ def client_from_cfg_name(
     all config that is available by default will be considered.
     An error will be raised if no team with the requested name can be found for the given Concourse
     instance in the config.
+
+    Clients are cached (and shared).
     '''
+    # serialise, so that concurrent callers (e.g. during pipeline-replication) do not each
+    # create (and login) a client
+    with _client_lock:
+        return _client_from_cfg_name(
+            concourse_cfg_name=concourse_cfg_name,
+            team_name=team_name,
+            cfg_factory=cfg_factory,
+        )
+
+
+@functools.lru_cache()
+def _client_from_cfg_name(
+    concourse_cfg_name: str,
+    team_name: str,
+    cfg_factory=None,
+):
     if not cfg_factory:
         cfg_factory = ci.util.ctx().cfg_factory()
 
@@ -5,10 +5,15 @@
 
 import enum
 import functools
+import hashlib
 import logging
+import threading
 import urllib.parse
 
 import cachecontrol
+import cachecontrol.cache
+import cachecontrol.heuristics
+import cachetools
 import ocm
 import github3
 import github3.github
@@ -29,6 +34,51 @@ class SessionAdapter(enum.Enum):
     CACHE = 'cache'
 
 
+class _LRUDictCache(cachecontrol.cache.DictCache):
+    '''
+    bounded variant of cachecontrol's DictCache (which grows indefinitely). Bounded by total size
+    (in bytes) of cached (serialised) responses; responses larger than `max_item_size` (e.g.
+    file-contents or archives) are not cached at all.
+    '''
+    def __init__(
+        self,
+        maxsize: int=8 * 1024 * 1024, # 8 MiB
+        max_item_size: int=256 * 1024, # 256 KiB
+    ):
+        super().__init__()
+        self.data = cachetools.LRUCache(maxsize=maxsize, getsizeof=len)
+        self.max_item_size = min(max_item_size, maxsize)
+
+    def get(self, key: str) -> bytes | None:
+        # lru-cache updates its bookkeeping upon reads
+        with self.lock:
+            return self.data.get(key)
+
+    def set(self, key: str, value: bytes, expires: int | None=None) -> None:
+        with self.lock:
+            if len(value) > self.max_item_size:
+                # drop outdated entry, if any
+                self.data.pop(key, None)
+                return
+
+            self.data[key] = value
+
+
+class _AlwaysRevalidate(cachecontrol.heuristics.BaseHeuristic):
+    '''
+    github-api responses are returned w/ `Cache-Control: private, max-age=60`, which would
+    cause cached responses to be served w/o asking github for up to one minute. Drop
+    freshness-lifetime s.t. cached responses are only used for conditional requests
+    (`If-None-Match`), which github answers w/ 304 (not accounted against rate-limit) if
+    unchanged.
+    '''
+    def update_headers(self, response) -> dict[str, str]:
+        return {'cache-control': 'private, max-age=0'}
+
+    def warning(self, response) -> None:
+        return None
+
+
 def github_api_ctor(
     github_cfg: model.github.GithubConfig,
     github_username: str,
@@ -59,8 +109,10 @@ def github_api_ctor(
     elif session_adapter is SessionAdapter.RETRY:
         session = http_requests.mount_default_adapter(
             session=session,
-            flags=http_requests.AdapterFlag.RETRY,
+            flags=http_requests.AdapterFlag.RETRY | http_requests.AdapterFlag.CACHE,
             max_pool_size=16, # increase with care, might cause github api "secondary-rate-limit"
+            cache=_LRUDictCache(),
+            cache_heuristic=_AlwaysRevalidate(),
         )
     elif session_adapter is SessionAdapter.CACHE:
         session = cachecontrol.CacheControl(
@@ -84,6 +136,12 @@ def github_api_ctor(
         )
 
 
+# github-api-objects (and thus their sessions, including connection-pools and etag-caches)
+# are reused for identical endpoints and credentials
+_github_api_cache = cachetools.LRUCache(maxsize=64)
+_github_api_cache_lock = threading.Lock()
+
+
 def github_api(
     github_cfg: model.github.GithubConfig=None,
     repo_url: str=None,
@@ -119,6 +177,17 @@ def github_api(
     github_username = github_credentials.username()
 
     verify_ssl = github_cfg.tls_validation()
+    session_adapter = SessionAdapter(session_adapter)
+
+    cache_key = (
+        github_cfg.api_url(),
+        hashlib.sha256(github_auth_token.encode('utf-8')).hexdigest(),
+        verify_ssl,
+        session_adapter,
+    )
+    with _github_api_cache_lock:
+        if (github_api := _github_api_cache.get(cache_key)):
+            return github_api
 
     github_ctor = github_api_ctor(
         github_cfg=github_cfg,
@@ -137,6 +206,9 @@ def github_api(
     if not 'github.com' in github_cfg.api_url():
         github_api._github_url = github_cfg.api_url()
 
+    with _github_api_cache_lock:
+        _github_api_cache[cache_key] = github_api
+
     return github_api
 
 
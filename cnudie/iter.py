@@ -10,8 +10,10 @@ if 'ocm.iter' in sys.modules:
     )
 
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
+import math
 
 import cnudie.retrieve
 import ocm
@@ -23,15 +25,21 @@ class NodeReferenceType(enum.StrEnum):
     EXTRA_COMPONENT_REFS_LABEL = f'label:{ocm.gardener.ExtraComponentReferencesLabel.name}'
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NodePathEntry:
     component: ocm.Component
     reftype: NodeReferenceType = NodeReferenceType.COMPONENT_REFERENCE
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Node:
     path: tuple[NodePathEntry]
+    _component_id: ocm.ComponentIdentity | None = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     @property
     def component(self):
@@ -39,10 +47,12 @@ class Node:
 
     @property
     def component_id(self):
-        return self.component.identity()
+        if self._component_id is None:
+            self._component_id = self.component.identity()
+        return self._component_id
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ComponentNode(Node):
     def __str__(self) -> str:
         return f'{self.component.name}:{self.component.version}'
@@ -55,12 +65,11 @@ class ArtefactNode:
     - artefact property (useful for iterating over mixed node-types)
     - iterable (useful for pattern-matching, e.g. c,a = node)
     '''
+    __slots__ = () # keep (slotted) subclasses free of __dict__
+
     @property
     def artefact(self) -> ocm.Resource | ocm.Source:
-        if isinstance(self, ResourceNode):
-            return self.resource
-        if isinstance(self, SourceNode):
-            return self.source
+        # overwritten by ResourceNode and SourceNode
         raise TypeError('must be of type ResourceNode or SourceNode')
 
     def __iter__(
@@ -71,10 +80,14 @@ class ArtefactNode:
         yield self.artefact
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourceNode(Node, ArtefactNode):
     resource: ocm.Resource
 
+    @property
+    def artefact(self) -> ocm.Resource:
+        return self.resource
+
     def __str__(self) -> str:
         return (
             f'{self.component.name}:{self.component.version} - '
@@ -82,10 +95,14 @@ class ResourceNode(Node, ArtefactNode):
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SourceNode(Node, ArtefactNode):
     source: ocm.Source
 
+    @property
+    def artefact(self) -> ocm.Source:
+        return self.source
+
     def __str__(self) -> str:
         return (
             f'{self.component.name}:{self.component.version} - '
@@ -94,21 +111,62 @@ class SourceNode(Node, ArtefactNode):
 
 
 class Filter:
+    # node-types are not intended to be subclassed; hence, check for type-identity (which is
+    # cheaper than isinstance-checks)
     @staticmethod
     def components(node: Node):
-        return isinstance(node, ComponentNode)
+        return type(node) is ComponentNode
 
     @staticmethod
     def artefacts(node: Node):
-        return isinstance(node, ArtefactNode)
+        return type(node) in (ResourceNode, SourceNode)
 
     @staticmethod
     def resources(node: Node):
-        return isinstance(node, ResourceNode)
+        return type(node) is ResourceNode
 
     @staticmethod
     def sources(node: Node):
-        return isinstance(node, SourceNode)
+        return type(node) is SourceNode
+
+
+def _component_key(
+    name: str,
+    version: str,
+) -> str:
+    '''
+    returns a (interned) key for the component identified by given name and version. Used (instead
+    of ComponentIdentity) for bookkeeping of seen components, as hashing and comparing interned
+    strings is cheaper (ComponentIdentity's hash is computed by a Python-level function)
+    '''
+    return sys.intern(f'{name}:{version}')
+
+
+def _iter_referenced_components(
+    component: ocm.Component,
+) -> collections.abc.Generator[tuple[str, str, NodeReferenceType], None, None]:
+    '''
+    yields name and version of all components directly referenced by the given component, i.e.
+    both from `componentReferences` and from the extra-component-references-label, along with the
+    respective reference type
+    '''
+    for cref in component.componentReferences:
+        yield cref.componentName, cref.version, NodeReferenceType.COMPONENT_REFERENCE
+
+    if not component.labels:
+        return # common case - avoid scanning for extra-crefs-label
+
+    if not (extra_crefs_label := component.find_label(
+        name=ocm.gardener.ExtraComponentReferencesLabel.name,
+    )):
+        return
+
+    for extra_cref in extra_crefs_label.value:
+        yield (
+            extra_cref['component_reference']['name'],
+            extra_cref['component_reference']['version'],
+            NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL,
+        )
 
 
 def iter(
@@ -120,6 +178,8 @@ def iter(
     ocm_repo: ocm.OcmRepository | str=None,
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
     reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+    max_concurrent_lookups: int=16,
+    _emit: frozenset[type[Node]] | None=None,
 ) -> collections.abc.Generator[Node, None, None]:
     '''
     returns a generator yielding the transitive closure of nodes accessible from the given component.
@@ -141,110 +201,182 @@ def iter(
     @param reftype_filter: use to exclude components (and their references) from the iterator if
                            they are of a certain reference type; thereby `True` means the component
                            should be filtered out
+    @param max_concurrent_lookups: upper bound for lookups of referenced components which are
+                                   run concurrently
+    @param _emit: (internal) node-types to emit; other nodes are not even instantiated (which is
+                  cheaper than passing a node_filter). Intended for curried variants of `iter`
     '''
     if isinstance(component, ocm.ComponentDescriptor):
         component = component.component
 
-    seen_component_ids = set()
+    emit_components = not _emit or ComponentNode in _emit
+    emit_resources = not _emit or ResourceNode in _emit
+    emit_sources = not _emit or SourceNode in _emit
+
+    # component-key (see _component_key) -> greatest remaining recursion-depth it was traversed w/
+    # (math.inf if unlimited). Components reached again w/ more remaining depth need to be traversed
+    # again, as otherwise references within reach would be lost.
+    seen_component_depths: dict[str, int | float] = {}
+    # component-keys of components nodes were already emitted for (components traversed again w/
+    # more remaining depth are only descended into, but not emitted again)
+    emitted_component_keys: set[str] = set()
+    # referenced components may be reachable through multiple paths; memoise lookups (as futures,
+    # so concurrently pending lookups for the same component are also only issued once)
+    lookup_results: dict[str, concurrent.futures.Future] = {}
 
     if not lookup and not recursion_depth == 0:
         raise ValueError('lookup is required if recusion is not disabled (recursion_depth==0)')
 
-    # need to nest actual iterator to keep global state of seen component-IDs
-    def inner_iter(
-        component: ocm.Component,
-        lookup: cnudie.retrieve.ComponentDescriptorLookupById,
-        recursion_depth,
-        path: tuple[NodePathEntry]=(),
-        reftype: NodeReferenceType=NodeReferenceType.COMPONENT_REFERENCE,
-    ):
-        if component_filter and component_filter(component):
-            return
+    def cached_lookup(
+        component_key: str,
+        name: str,
+        version: str,
+    ) -> concurrent.futures.Future:
+        if (lookup_result := lookup_results.get(component_key)):
+            return lookup_result
+
+        component_id = ocm.ComponentIdentity(
+            name=name,
+            version=version,
+        )
 
-        if reftype_filter and reftype_filter(reftype):
-            return
+        if ocm_repo:
+            lookup_result = pool.submit(lookup, component_id, ocm_repo)
+        else:
+            lookup_result = pool.submit(lookup, component_id)
 
-        path = (*path, NodePathEntry(component, reftype))
+        lookup_results[component_key] = lookup_result
+        return lookup_result
 
-        yield ComponentNode(
-            path=path,
-        )
+    def iter_unfiltered(
+        root_component: ocm.Component,
+    ):
+        # bind globals used in loop-body to locals (avoids dict-lookups for each emitted node)
+        _ComponentNode = ComponentNode
+        _ResourceNode = ResourceNode
+        _SourceNode = SourceNode
+        _NodePathEntry = NodePathEntry
+
+        # traverse depth-first using an explicit stack (rather than recursing through nested
+        # generators, which would need to pass each node through all ancestors' generators).
+        # referenced components are pushed as (pending) lookup-results. Entries are:
+        # (component or lookup-result, component-key, parent-path, recursion-depth, reftype)
+        stack = [(
+            root_component,
+            _component_key(root_component.name, root_component.version),
+            (),
+            recursion_depth,
+            NodeReferenceType.COMPONENT_REFERENCE,
+        )]
+
+        def already_seen(component_key: str, depth: int) -> bool:
+            remaining_depth = math.inf if depth < 0 else depth
+            return seen_component_depths.get(component_key, -1) >= remaining_depth
+
+        while stack:
+            component_or_result, component_key, path, depth, reftype = stack.pop()
+
+            if prune_unique and already_seen(component_key, depth):
+                # might have been traversed meanwhile (through one of the preceding references)
+                continue
 
-        for resource in component.resources:
-            yield ResourceNode(
-                path=path,
-                resource=resource,
-            )
-
-        for source in component.sources:
-            yield SourceNode(
-                path=path,
-                source=source,
-            )
-
-        if recursion_depth == 0:
-            return # stop resolving referenced components
-        elif recursion_depth > 0:
-            recursion_depth -= 1
-
-        for cref in component.componentReferences:
-            cref_id = ocm.ComponentIdentity(
-                name=cref.componentName,
-                version=cref.version,
-            )
-
-            if ocm_repo:
-                referenced_component_descriptor = lookup(cref_id, ocm_repo)
+            if isinstance(component_or_result, concurrent.futures.Future):
+                component = component_or_result.result().component
             else:
-                referenced_component_descriptor = lookup(cref_id)
-
-            yield from inner_iter(
-                component=referenced_component_descriptor.component,
-                lookup=lookup,
-                recursion_depth=recursion_depth,
-                path=path,
-            )
-
-        if not (extra_crefs_label := component.find_label(
-            name=ocm.gardener.ExtraComponentReferencesLabel.name,
-        )):
-            return
-
-        for extra_cref in extra_crefs_label.value:
-            extra_cref_id = ocm.ComponentIdentity(
-                name=extra_cref['component_reference']['name'],
-                version=extra_cref['component_reference']['version'],
-            )
-
-            if ocm_repo:
-                referenced_component_descriptor = lookup(extra_cref_id, ocm_repo)
+                component = component_or_result
+
+            if component_filter and component_filter(component):
+                continue
+
+            if reftype_filter and reftype_filter(reftype):
+                continue
+
+            if prune_unique:
+                seen_component_depths[component_key] = math.inf if depth < 0 else depth
+
+                emit = component_key not in emitted_component_keys
+                emitted_component_keys.add(component_key)
             else:
-                referenced_component_descriptor = lookup(extra_cref_id)
+                emit = True
+
+            path = (*path, _NodePathEntry(component, reftype))
+
+            if emit and emit_components:
+                yield _ComponentNode(
+                    path=path,
+                )
+
+            if emit and emit_resources:
+                for resource in component.resources:
+                    yield _ResourceNode(
+                        path=path,
+                        resource=resource,
+                    )
+
+            if emit and emit_sources:
+                for source in component.sources:
+                    yield _SourceNode(
+                        path=path,
+                        source=source,
+                    )
+
+            if depth == 0:
+                continue # stop resolving referenced components
+            elif depth > 0:
+                depth -= 1
+
+            # lookups are I/O-bound; resolve all references of current component concurrently
+            referenced_components = []
+            for name, version, reftype in _iter_referenced_components(component):
+                if reftype_filter and reftype_filter(reftype):
+                    continue
+
+                cref_key = _component_key(name, version)
+                if prune_unique and already_seen(cref_key, depth):
+                    continue
+
+                referenced_components.append(
+                    (cached_lookup(cref_key, name, version), cref_key, path, depth, reftype)
+                )
+
+            # push in reverse order, so references are traversed in order
+            stack.extend(reversed(referenced_components))
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_lookups)
+
+    try:
+        for node in iter_unfiltered(component):
+            if node_filter and not node_filter(node):
+                continue
+
+            yield node
+    finally:
+        # do not block on pending lookups if iteration is aborted early
+        pool.shutdown(wait=False, cancel_futures=True)
 
-            yield from inner_iter(
-                component=referenced_component_descriptor.component,
-                lookup=lookup,
-                recursion_depth=recursion_depth,
-                path=path,
-                reftype=NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL,
-            )
 
-    for node in inner_iter(
+def iter_components(
+    component: ocm.Component,
+    lookup: cnudie.retrieve.ComponentDescriptorLookupById=None,
+    recursion_depth: int=-1,
+    prune_unique: bool=True,
+    component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
+    reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+    max_concurrent_lookups: int=16,
+) -> collections.abc.Generator[ComponentNode, None, None]:
+    '''
+    curried version of `iter` preset to yield only component-nodes
+    '''
+    return iter(
         component=component,
         lookup=lookup,
         recursion_depth=recursion_depth,
-        path=(),
-    ):
-        if node_filter and not node_filter(node):
-            continue
-
-        if prune_unique and isinstance(node, ComponentNode):
-            if node.component.identity() in seen_component_ids:
-                continue
-            else:
-                seen_component_ids.add(node.component_id)
-
-        yield node
+        prune_unique=prune_unique,
+        component_filter=component_filter,
+        reftype_filter=reftype_filter,
+        max_concurrent_lookups=max_concurrent_lookups,
+        _emit=frozenset((ComponentNode,)),
+    )
 
 
 def iter_resources(
@@ -254,16 +386,42 @@ def iter_resources(
     prune_unique: bool=True,
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
     reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+    max_concurrent_lookups: int=16,
 ) -> collections.abc.Generator[ResourceNode, None, None]:
     '''
-    curried version of `iter` w/ node-filter preset to yield only resource-nodes
+    curried version of `iter` preset to yield only resource-nodes
+    '''
+    return iter(
+        component=component,
+        lookup=lookup,
+        recursion_depth=recursion_depth,
+        prune_unique=prune_unique,
+        component_filter=component_filter,
+        reftype_filter=reftype_filter,
+        max_concurrent_lookups=max_concurrent_lookups,
+        _emit=frozenset((ResourceNode,)),
+    )
+
+
+def iter_sources(
+    component: ocm.Component,
+    lookup: cnudie.retrieve.ComponentDescriptorLookupById=None,
+    recursion_depth: int=-1,
+    prune_unique: bool=True,
+    component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
+    reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
+    max_concurrent_lookups: int=16,
+) -> collections.abc.Generator[SourceNode, None, None]:
+    '''
+    curried version of `iter` preset to yield only source-nodes
     '''
     return iter(
         component=component,
         lookup=lookup,
         recursion_depth=recursion_depth,
         prune_unique=prune_unique,
-        node_filter=Filter.resources,
         component_filter=component_filter,
         reftype_filter=reftype_filter,
+        max_concurrent_lookups=max_concurrent_lookups,
+        _emit=frozenset((SourceNode,)),
     )
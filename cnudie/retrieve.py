@@ -1,19 +1,26 @@
 import collections.abc
+import concurrent.futures
 import dataclasses
+import functools
 import io
 import itertools
 import json
 import logging
 import os
-import shutil
 import tarfile
 import tempfile
+import threading
 
 import cachetools
 import dacite
 import requests
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 import ocm
 import ocm.oci
 import ocm.iter as oi
@@ -91,6 +98,18 @@ def iter_ocm_repositories(
                 yield cfg
 
 
+@functools.lru_cache(maxsize=1024)
+def oci_ocm_repository(base_url: str, /) -> ocm.OciOcmRepository:
+    '''
+    returns an OciOcmRepository for the given base-url. As OciOcmRepository is immutable, returned
+    objects are memoised, avoiding repeated instantiation for each lookup.
+    '''
+    return ocm.OciOcmRepository(
+        type=ocm.AccessType.OCI_REGISTRY,
+        baseUrl=base_url,
+    )
+
+
 def ocm_repository_lookup(*repository_cfgs: OcmRepositoryCfg):
     def lookup(
         component: str | ocm.ComponentIdentity | ocm.Component,
@@ -127,7 +146,8 @@ def in_memory_cache_component_descriptor_lookup(
     '''
     Used to lookup referenced component descriptors in the in-memory cache.
     In case of a cache miss, the required component descriptor can be added
-    to the cache by using the writeback function.
+    to the cache by using the writeback function. The returned lookup (and
+    writeback) may safely be shared between threads.
 
     @param cache_ctor:
         specification of the cache implementation
@@ -138,13 +158,16 @@ def in_memory_cache_component_descriptor_lookup(
     '''
     cache_kwargs['maxsize'] = cache_kwargs.get('maxsize', 2048)
     cache = cache_ctor(**cache_kwargs)
+    # caches from cachetools are not thread-safe (reads also mutate, e.g. LRU-order)
+    cache_lock = threading.RLock()
 
     def writeback(
         component_id: ocm.ComponentIdentity,
         component_descriptor: ocm.ComponentDescriptor,
     ):
         if (ocm_repo := component_descriptor.component.current_ocm_repo):
-            cache.__setitem__((component_id, ocm_repo), component_descriptor)
+            with cache_lock:
+                cache.__setitem__((component_id, ocm_repo), component_descriptor)
         else:
             raise ValueError(ocm_repo)
 
@@ -161,15 +184,11 @@ def in_memory_cache_component_descriptor_lookup(
 
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.AccessType.OCI_REGISTRY,
-                    baseUrl=ocm_repo,
-                )
-            try:
-                if (component_descriptor := cache.get((component_id, ocm_repo))):
-                    return component_descriptor
-            except KeyError:
-                pass
+                ocm_repo = oci_ocm_repository(ocm_repo)
+            with cache_lock:
+                component_descriptor = cache.get((component_id, ocm_repo))
+            if component_descriptor:
+                return component_descriptor
 
         # component descriptor not found in lookup
         return _writeback
@@ -177,6 +196,105 @@ def in_memory_cache_component_descriptor_lookup(
     return lookup
 
 
+def file_system_cache_path(
+    cache_dir: str,
+    ocm_repo: ocm.OciOcmRepository,
+    component_id: ocm.ComponentIdentity,
+    suffix: str='.json',
+) -> str:
+    return os.path.join(
+        cache_dir,
+        ocm_repo.oci_ref.replace('/', '-'),
+        f'{component_id.name}-{component_id.version}{suffix}',
+    )
+
+
+def _is_file_in_cache_dir(
+    path: str,
+    dir_index: dict[str, set[str]] | None,
+) -> bool:
+    '''
+    checks whether file exists at given path. If `dir_index` is passed, directory-entries are
+    listed once per directory (and then stored in `dir_index`), rather than stat'ing each file.
+    '''
+    if dir_index is None:
+        return os.path.isfile(path)
+
+    base_dir, filename = os.path.split(path)
+    if (entries := dir_index.get(base_dir)) is None:
+        try:
+            with os.scandir(base_dir) as dir_entries:
+                entries = {entry.name for entry in dir_entries}
+        except FileNotFoundError:
+            entries = set()
+        dir_index[base_dir] = entries
+
+    return filename in entries
+
+
+def _forget_file_in_cache_dir(
+    path: str,
+    dir_index: dict[str, set[str]] | None,
+):
+    '''
+    removes file at given path from `dir_index` (if passed), e.g. if it was removed from cache-dir
+    after directory-entries were listed
+    '''
+    if dir_index is None:
+        return
+
+    base_dir, filename = os.path.split(path)
+    if (entries := dir_index.get(base_dir)) is not None:
+        entries.discard(filename)
+
+
+def read_from_file_system_cache(
+    cache_dir: str,
+    ocm_repo: ocm.OciOcmRepository,
+    component_id: ocm.ComponentIdentity,
+    dir_index: dict[str, set[str]]=None,
+) -> ocm.ComponentDescriptor | None:
+    '''
+    reads component descriptor from file-system cache. Descriptors are stored as JSON; as a
+    fallback, descriptors stored in YAML format (without file-suffix) by previous versions are
+    also read.
+
+    @param dir_index:
+        optional index of cache-directory entries (by directory), lazily filled and used to
+        check for cached descriptors, instead of stat'ing them. Must be kept up-to-date by caller
+        when adding descriptors to the cache.
+    '''
+    descriptor_path = file_system_cache_path(
+        cache_dir=cache_dir,
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+    )
+    if _is_file_in_cache_dir(descriptor_path, dir_index):
+        try:
+            with open(descriptor_path, 'rb') as f:
+                return ocm.ComponentDescriptor.from_dict(json.load(f))
+        except FileNotFoundError:
+            # removed meanwhile (cache-dir might be pruned or shared) -> cache-miss
+            _forget_file_in_cache_dir(descriptor_path, dir_index)
+
+    legacy_descriptor_path = file_system_cache_path(
+        cache_dir=cache_dir,
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+        suffix='',
+    )
+    if _is_file_in_cache_dir(legacy_descriptor_path, dir_index):
+        try:
+            with open(legacy_descriptor_path) as f:
+                return ocm.ComponentDescriptor.from_dict(
+                    yaml.load(f, Loader=YamlSafeLoader)
+                )
+        except FileNotFoundError:
+            _forget_file_in_cache_dir(legacy_descriptor_path, dir_index)
+
+    return None
+
+
 def file_system_cache_component_descriptor_lookup(
     ocm_repository_lookup: OcmRepositoryLookup=None,
     cache_dir: str=None,
@@ -195,6 +313,9 @@ def file_system_cache_component_descriptor_lookup(
     if not cache_dir:
         raise ValueError(cache_dir)
 
+    # directory-entries of cache-dir, by directory (see read_from_file_system_cache)
+    dir_index: dict[str, set[str]] = {}
+
     def writeback(
         component_id: ocm.ComponentIdentity,
         component_descriptor: ocm.ComponentDescriptor,
@@ -202,30 +323,36 @@ def file_system_cache_component_descriptor_lookup(
         if not (ocm_repo := component_descriptor.component.current_ocm_repo):
             raise ValueError(ocm_repo)
 
+        descriptor_path = file_system_cache_path(
+            cache_dir=cache_dir,
+            ocm_repo=ocm_repo,
+            component_id=component_id,
+        )
+        base_dir, filename = os.path.split(descriptor_path)
+        os.makedirs(name=base_dir, exist_ok=True)
+
+        # write to tempfile, followed by a rename to avoid collisions through concurrent
+        # processes or threads. tempfile is created in target directory, so rename is atomic
+        # (and cheap, as opposed to moving across file-systems)
+        f = tempfile.NamedTemporaryFile(mode='w', delete=False, dir=base_dir, prefix='.tmp-')
         try:
-            f = tempfile.NamedTemporaryFile(mode='w', delete=False)
-            # write to tempfile, followed by a mv to avoid collisions through concurrent
-            # processes or threads (assuming mv is an atomic operation)
-            yaml.dump(
-                data=dataclasses.asdict(component_descriptor),
-                Dumper=ocm.EnumValueYamlDumper,
-                stream=f.file,
+            json.dump(
+                obj=component_descriptor, # serialised w/o intermediate copy by EnumJSONEncoder
+                fp=f.file,
+                cls=ocm.EnumJSONEncoder,
             )
+            f.flush()
+            os.fsync(f.fileno())
             f.close() # need to close filehandle for NT
-
-            descriptor_path = os.path.join(
-                cache_dir,
-                ocm_repo.oci_ref.replace('/', '-'),
-                f'{component_id.name}-{component_id.version}',
-            )
-            if not os.path.isfile(descriptor_path):
-                base_dir = os.path.dirname(descriptor_path)
-                os.makedirs(name=base_dir, exist_ok=True)
-            shutil.move(f.name, descriptor_path)
+            os.replace(f.name, descriptor_path)
         except:
+            f.close()
             os.unlink(f.name)
             raise
 
+        if (entries := dir_index.get(base_dir)) is not None:
+            entries.add(filename)
+
     _writeback = WriteBack(writeback)
 
     def lookup(
@@ -242,26 +369,20 @@ def file_system_cache_component_descriptor_lookup(
                 raise ValueError(ocm_repo)
 
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.AccessType.OCI_REGISTRY,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = oci_ocm_repository(ocm_repo)
 
             if not isinstance(ocm_repo, ocm.OciOcmRepository):
                 raise NotImplementedError(ocm_repo)
 
             component_id = cnudie.util.to_component_id(component_id)
 
-            descriptor_path = os.path.join(
-                cache_dir,
-                ocm_repo.oci_ref.replace('/', '-'),
-                f'{component_id.name}-{component_id.version}',
-            )
-            if os.path.isfile(descriptor_path):
-                with open(descriptor_path) as f:
-                    return ocm.ComponentDescriptor.from_dict(
-                        yaml.safe_load(f)
-                    )
+            if (component_descriptor := read_from_file_system_cache(
+                cache_dir=cache_dir,
+                ocm_repo=ocm_repo,
+                component_id=component_id,
+                dir_index=dir_index,
+            )):
+                return component_descriptor
 
         # component descriptor not found in lookup
         return _writeback
@@ -302,6 +423,11 @@ def delivery_service_component_descriptor_lookup(
     if not delivery_client:
         raise ValueError(delivery_client)
 
+    # remember (for a short time) component descriptors not known to delivery-service, to avoid
+    # repeatedly querying for them (e.g. if referenced multiple times from a component-tree)
+    absent_component_descriptors = cachetools.TTLCache(maxsize=1024, ttl=60)
+    absent_component_descriptors_lock = threading.Lock()
+
     def lookup(
         component_id: ocm.ComponentIdentity,
         ocm_repository_lookup: OcmRepositoryLookup=ocm_repository_lookup,
@@ -321,25 +447,30 @@ def delivery_service_component_descriptor_lookup(
 
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.AccessType.OCI_REGISTRY,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = oci_ocm_repository(ocm_repo)
 
             if ocm_repo and not isinstance(ocm_repo, ocm.OciOcmRepository):
                 raise NotImplementedError(ocm_repo)
 
+            ocm_repo_url = ocm_repo.oci_ref if ocm_repo else None
+            cache_key = (component_id, ocm_repo_url)
+            with absent_component_descriptors_lock:
+                if cache_key in absent_component_descriptors:
+                    continue
+
             try:
                 component_descriptor = delivery_client.component_descriptor(
                     name=component_id.name,
                     version=component_id.version,
-                    ocm_repo_url=ocm_repo.oci_ref if ocm_repo else None,
+                    ocm_repo_url=ocm_repo_url,
                 )
 
                 if component_descriptor:
                     return component_descriptor
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 404:
+                    with absent_component_descriptors_lock:
+                        absent_component_descriptors[cache_key] = None
                     continue
                 elif e.response.status_code >= 500:
                     # in case delivery-service is not reachable, fallback to next lookup (if any)
@@ -357,6 +488,12 @@ def delivery_service_component_descriptor_lookup(
     return lookup
 
 
+@functools.cache
+def _optimistic_layer_retrieval_pool() -> concurrent.futures.ThreadPoolExecutor:
+    # shared by all lookups (created lazily upon first use, and reused)
+    return concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+
 def _raw_component_descriptor_from_oci(
     component_id: ocm.ComponentIdentity,
     ocm_repos: collections.abc.Iterable[ocm.OciOcmRepository | str],
@@ -365,9 +502,7 @@ def _raw_component_descriptor_from_oci(
 ) -> bytes | None:
     for ocm_repo in ocm_repos:
         if isinstance(ocm_repo, str):
-            ocm_repo = ocm.OciOcmRepository(
-                baseUrl=ocm_repo,
-            )
+            ocm_repo = oci_ocm_repository(ocm_repo)
 
         if not isinstance(ocm_repo, ocm.OciOcmRepository):
             raise NotImplementedError(ocm_repo)
@@ -393,20 +528,41 @@ def _raw_component_descriptor_from_oci(
     elif not manifest:
         raise om.OciImageNotFoundException
 
+    def retrieve_layer_blob(digest: str) -> bytes:
+        return oci_client.blob(
+            image_reference=target_ref,
+            digest=digest,
+            stream=False, # manifests are typically small - do not bother w/ streaming
+        ).content
+
+    # by contract, there is typically exactly one layer (tar w/ component-descriptor) -> retrieve
+    # it optimistically, concurrently to cfg-blob (which references the actual layer), to save a
+    # roundtrip
+    if len(manifest.layers) == 1:
+        optimistic_layer_digest = manifest.layers[0].digest
+        optimistic_layer_blob = _optimistic_layer_retrieval_pool().submit(
+            retrieve_layer_blob,
+            optimistic_layer_digest,
+        )
+    else:
+        optimistic_layer_digest = None
+        optimistic_layer_blob = None
+
     try:
         cfg_dict = json.loads(
             oci_client.blob(
                 image_reference=target_ref,
                 digest=manifest.config.digest,
-            ).text
-        )
-        cfg = dacite.from_dict(
-            data_class=ocm.oci.ComponentDescriptorOciCfg,
-            data=cfg_dict,
+                stream=False,
+            ).content # json.loads accepts bytes; avoids decoding into str first
         )
+        cfg = ocm.oci.ComponentDescriptorOciCfg.from_dict(cfg_dict)
         layer_digest = cfg.componentDescriptorLayer.digest
         layer_mimetype = cfg.componentDescriptorLayer.mediaType
-    except Exception as e:
+    except (
+        requests.exceptions.HTTPError,
+        ValueError, # includes json.JSONDecodeError, and malformed cfg
+    ) as e:
         logger.warning(
             f'Failed to parse or retrieve component-descriptor-cfg: {e=}. '
             'falling back to single-layer'
@@ -423,11 +579,14 @@ def _raw_component_descriptor_from_oci(
         logger.warning(f'{target_ref=} {layer_mimetype=} was unexpected')
         # XXX: check for non-tar-variant
 
-    return oci_client.blob(
-        image_reference=target_ref,
-        digest=layer_digest,
-        stream=False, # manifests are typically small - do not bother w/ streaming
-    ).content
+    if layer_digest == optimistic_layer_digest:
+        return optimistic_layer_blob.result()
+
+    if optimistic_layer_digest and not optimistic_layer_blob.cancel():
+        # retrieval already running (or done) - consume (and discard) its outcome
+        optimistic_layer_blob.add_done_callback(lambda future: future.exception())
+
+    return retrieve_layer_blob(layer_digest)
 
 
 def oci_component_descriptor_lookup(
@@ -450,6 +609,16 @@ def oci_component_descriptor_lookup(
     if not oci_client:
         raise ValueError(oci_client)
 
+    # component-descriptors are not expected to change for a given version -> avoid repeated
+    # retrieval (of manifest and blobs) from oci-registry; cache is bounded by total size of
+    # cached blobs, and only reasonably small blobs are cached
+    raw_descriptor_cache = cachetools.LRUCache(
+        maxsize=32 * 1024 * 1024, # 32 MiB
+        getsizeof=len,
+    )
+    raw_descriptor_cache_lock = threading.Lock()
+    max_cached_raw_descriptor_size = 1024 * 1024 # 1 MiB
+
     def lookup(
         component_id: ocm.ComponentIdentity,
         ocm_repository_lookup: OcmRepositoryLookup=ocm_repository_lookup,
@@ -472,16 +641,24 @@ def oci_component_descriptor_lookup(
 
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    baseUrl=ocm_repo,
+                ocm_repo = oci_ocm_repository(ocm_repo)
+
+            cache_key = (component_id, ocm_repo)
+            with raw_descriptor_cache_lock:
+                raw = raw_descriptor_cache.get(cache_key)
+
+            if not raw:
+                raw = _raw_component_descriptor_from_oci(
+                    component_id=component_id,
+                    ocm_repos=(ocm_repo,),
+                    oci_client=local_oci_client,
+                    absent_ok=True,
                 )
+                if raw and len(raw) <= max_cached_raw_descriptor_size:
+                    with raw_descriptor_cache_lock:
+                        raw_descriptor_cache[cache_key] = raw
 
-            if raw := _raw_component_descriptor_from_oci(
-                component_id=component_id,
-                ocm_repos=(ocm_repo,),
-                oci_client=local_oci_client,
-                absent_ok=True,
-            ):
+            if raw:
                 break
         else:
             raw = None
@@ -535,6 +712,32 @@ def version_lookup(
     if not oci_client:
         raise ValueError(oci_client)
 
+    # tag-listings may be large and are often requested repeatedly for the same component (e.g.
+    # for determining different version-candidates); keep them for a short time only to not miss
+    # newly published versions
+    component_versions_cache = cachetools.TTLCache(maxsize=256, ttl=30)
+    component_versions_cache_lock = threading.Lock()
+
+    def component_versions(
+        component_name: str,
+        ocm_repo: ocm.OciOcmRepository,
+    ) -> collections.abc.Sequence[str]:
+        cache_key = ocm_repo.component_oci_ref(component_name)
+        with component_versions_cache_lock:
+            if (versions := component_versions_cache.get(cache_key)) is not None:
+                return versions
+
+        versions = tuple(_component_versions(
+            component_name=component_name,
+            ocm_repo=ocm_repo,
+            oci_client=oci_client,
+        ))
+
+        with component_versions_cache_lock:
+            component_versions_cache[cache_key] = versions
+
+        return versions
+
     def lookup(
         component_id: ComponentName,
         ocm_repository_lookup: OcmRepositoryLookup=ocm_repository_lookup,
@@ -549,20 +752,15 @@ def version_lookup(
         versions = set()
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.OciAccess,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = oci_ocm_repository(ocm_repo)
             if not isinstance(ocm_repo, ocm.OciOcmRepository):
                 raise NotImplementedError(ocm_repo)
 
             try:
-                for version_tag in _component_versions(
+                versions.update(component_versions(
                     component_name=component_name,
                     ocm_repo=ocm_repo,
-                    oci_client=oci_client,
-                ):
-                    versions.add(version_tag)
+                ))
             except requests.exceptions.HTTPError as e:
                 if (error_code := e.response.status_code) == 404:
                     continue
@@ -693,11 +891,6 @@ def create_default_component_descriptor_lookup(
         import ctx
         ocm_repository_lookup = ctx.cfg.ctx.ocm_repository_lookup
 
-    lookups = [
-        in_memory_cache_component_descriptor_lookup(
-            ocm_repository_lookup=ocm_repository_lookup,
-        )
-    ]
     if not cache_dir:
         try:
             import ctx
@@ -707,6 +900,15 @@ def create_default_component_descriptor_lookup(
             # ctx-module is an optional dependency for local dev setups
             pass
 
+    # hits from file-system cache are promoted into in-memory cache (see composite-lookup); use a
+    # larger in-memory cache in this case to avoid evicting (and re-parsing) descriptors
+    lookups = [
+        in_memory_cache_component_descriptor_lookup(
+            ocm_repository_lookup=ocm_repository_lookup,
+            maxsize=8192 if cache_dir else 2048,
+        )
+    ]
+
     if cache_dir:
         lookups.append(
             file_system_cache_component_descriptor_lookup(
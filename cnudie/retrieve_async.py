@@ -1,10 +1,9 @@
 import collections.abc
-import dataclasses
 import io
 import itertools
+import json
 import logging
 import os
-import shutil
 import tarfile
 import tempfile
 
@@ -12,7 +11,6 @@ import aiohttp.client_exceptions
 import cachetools
 import dacite
 import requests
-import yaml
 
 
 import ocm
@@ -102,10 +100,7 @@ def in_memory_cache_component_descriptor_lookup(
 
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.AccessType.OCI_REGISTRY,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = cnudie.retrieve.oci_ocm_repository(ocm_repo)
             try:
                 if (component_descriptor := cache.get((component_id, ocm_repo))):
                     return component_descriptor
@@ -136,6 +131,9 @@ def file_system_cache_component_descriptor_lookup(
     if not cache_dir:
         raise ValueError(cache_dir)
 
+    # directory-entries of cache-dir, by directory (see read_from_file_system_cache)
+    dir_index: dict[str, set[str]] = {}
+
     async def writeback(
         component_id: ocm.ComponentIdentity,
         component_descriptor: ocm.ComponentDescriptor,
@@ -143,30 +141,36 @@ def file_system_cache_component_descriptor_lookup(
         if not (ocm_repo := component_descriptor.component.current_ocm_repo):
             raise ValueError(ocm_repo)
 
+        descriptor_path = cnudie.retrieve.file_system_cache_path(
+            cache_dir=cache_dir,
+            ocm_repo=ocm_repo,
+            component_id=component_id,
+        )
+        base_dir, filename = os.path.split(descriptor_path)
+        os.makedirs(name=base_dir, exist_ok=True)
+
+        # write to tempfile, followed by a rename to avoid collisions through concurrent
+        # processes or threads. tempfile is created in target directory, so rename is atomic
+        # (and cheap, as opposed to moving across file-systems)
+        f = tempfile.NamedTemporaryFile(mode='w', delete=False, dir=base_dir, prefix='.tmp-')
         try:
-            f = tempfile.NamedTemporaryFile(mode='w', delete=False)
-            # write to tempfile, followed by a mv to avoid collisions through concurrent
-            # processes or threads (assuming mv is an atomic operation)
-            yaml.dump(
-                data=dataclasses.asdict(component_descriptor),
-                Dumper=ocm.EnumValueYamlDumper,
-                stream=f.file,
+            json.dump(
+                obj=component_descriptor, # serialised w/o intermediate copy by EnumJSONEncoder
+                fp=f.file,
+                cls=ocm.EnumJSONEncoder,
             )
+            f.flush()
+            os.fsync(f.fileno())
             f.close() # need to close filehandle for NT
-
-            descriptor_path = os.path.join(
-                cache_dir,
-                ocm_repo.oci_ref.replace('/', '-'),
-                f'{component_id.name}-{component_id.version}',
-            )
-            if not os.path.isfile(descriptor_path):
-                base_dir = os.path.dirname(descriptor_path)
-                os.makedirs(name=base_dir, exist_ok=True)
-            shutil.move(f.name, descriptor_path)
+            os.replace(f.name, descriptor_path)
         except:
+            f.close()
             os.unlink(f.name)
             raise
 
+        if (entries := dir_index.get(base_dir)) is not None:
+            entries.add(filename)
+
     _writeback = WriteBack(writeback)
 
     async def lookup(
@@ -185,24 +189,18 @@ def file_system_cache_component_descriptor_lookup(
                 raise ValueError(ocm_repo)
 
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.AccessType.OCI_REGISTRY,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = cnudie.retrieve.oci_ocm_repository(ocm_repo)
 
             if not isinstance(ocm_repo, ocm.OciOcmRepository):
                 raise NotImplementedError(ocm_repo)
 
-            descriptor_path = os.path.join(
-                cache_dir,
-                ocm_repo.oci_ref.replace('/', '-'),
-                f'{component_id.name}-{component_id.version}',
-            )
-            if os.path.isfile(descriptor_path):
-                with open(descriptor_path) as f:
-                    return ocm.ComponentDescriptor.from_dict(
-                        yaml.safe_load(f),
-                    )
+            if (component_descriptor := cnudie.retrieve.read_from_file_system_cache(
+                cache_dir=cache_dir,
+                ocm_repo=ocm_repo,
+                component_id=component_id,
+                dir_index=dir_index,
+            )):
+                return component_descriptor
 
         # component descriptor not found in lookup
         return _writeback
@@ -263,10 +261,7 @@ def delivery_service_component_descriptor_lookup(
 
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.AccessType.OCI_REGISTRY,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = cnudie.retrieve.oci_ocm_repository(ocm_repo)
 
             if ocm_repo and not isinstance(ocm_repo, ocm.OciOcmRepository):
                 raise NotImplementedError(ocm_repo)
@@ -307,9 +302,7 @@ async def raw_component_descriptor_from_oci(
 ) -> bytes | None:
     for ocm_repo in ocm_repos:
         if isinstance(ocm_repo, str):
-            ocm_repo = ocm.OciOcmRepository(
-                baseUrl=ocm_repo,
-            )
+            ocm_repo = cnudie.retrieve.oci_ocm_repository(ocm_repo)
 
         if not isinstance(ocm_repo, ocm.OciOcmRepository):
             raise NotImplementedError(ocm_repo)
@@ -343,13 +336,13 @@ async def raw_component_descriptor_from_oci(
         cfg_dict = await cfg_blob.json(
             content_type='application/octet-stream'
         )
-        cfg = dacite.from_dict(
-            data_class=ocm.oci.ComponentDescriptorOciCfg,
-            data=cfg_dict,
-        )
+        cfg = ocm.oci.ComponentDescriptorOciCfg.from_dict(cfg_dict)
         layer_digest = cfg.componentDescriptorLayer.digest
         layer_mimetype = cfg.componentDescriptorLayer.mediaType
-    except Exception as e:
+    except (
+        aiohttp.client_exceptions.ClientResponseError,
+        ValueError, # includes json.JSONDecodeError, and malformed cfg
+    ) as e:
         logger.warning(
             f'Failed to parse or retrieve component-descriptor-cfg: {e=}. '
             'falling back to single-layer'
@@ -415,9 +408,7 @@ def oci_component_descriptor_lookup(
 
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = cnudie.retrieve.oci_ocm_repository(ocm_repo)
 
             if raw := await raw_component_descriptor_from_oci(
                 component_id=component_id,
@@ -472,10 +463,7 @@ def version_lookup(
         versions = set()
         for ocm_repo in ocm_repos:
             if isinstance(ocm_repo, str):
-                ocm_repo = ocm.OciOcmRepository(
-                    type=ocm.OciAccess,
-                    baseUrl=ocm_repo,
-                )
+                ocm_repo = cnudie.retrieve.oci_ocm_repository(ocm_repo)
             if not isinstance(ocm_repo, ocm.OciOcmRepository):
                 raise NotImplementedError(ocm_repo)
 
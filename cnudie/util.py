@@ -1,6 +1,8 @@
 import collections.abc
 import dataclasses
+import functools
 import graphlib
+import operator
 import textwrap
 
 import deprecated
@@ -33,6 +35,10 @@ def to_component_id(
     if isinstance(component, ocm.ComponentIdentity):
         return component
 
+    if isinstance(component, (str, tuple)):
+        # hashable -> memoise (lookups are typically called many times w/ same ids)
+        return _to_component_id_from_str_or_tuple(component)
+
     if isinstance(component, ocm.ComponentDescriptor) or hasattr(component, 'component'):
         component = component.component
         # fall through to next case
@@ -43,13 +49,24 @@ def to_component_id(
     if isinstance(component, ocm.ComponentReference) or hasattr(component, 'componentName'):
         name = component.componentName
         version = component.version
+
+    return ocm.ComponentIdentity(
+        name=name,
+        version=version,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_component_id_from_str_or_tuple(
+    component: str | tuple[str, str], /
+) -> ocm.ComponentIdentity:
     if isinstance(component, str):
         try:
             name, version = component.split(':', 1)
         except ValueError as ve:
             ve.add_note(f'{component=}')
             raise
-    if isinstance(component, tuple):
+    else:
         name, version = component
 
     return ocm.ComponentIdentity(
@@ -58,23 +75,37 @@ def to_component_id(
     )
 
 
+def _component_name_from_tuple(component: tuple[str, str], /) -> str:
+    if not len(component) == 2:
+        raise ValueError('expected two-tuple with two elements')
+    return component[0]
+
+
+_component_name_getters = {
+    ocm.ComponentDescriptor: operator.attrgetter('component.name'),
+    ocm.Component: operator.attrgetter('name'),
+    ocm.ComponentIdentity: operator.attrgetter('name'),
+    ocm.ComponentReference: operator.attrgetter('componentName'),
+    tuple: _component_name_from_tuple,
+}
+
+
 def to_component_name(
     component: ComponentName,
 ) -> str:
-    if isinstance(component, ocm.ComponentDescriptor):
-        component = component.component
-    if isinstance(component, ocm.Component):
-        component = component.name
-    elif isinstance(component, ocm.ComponentIdentity):
-        component = component.name
-    elif isinstance(component, ocm.ComponentReference):
-        component = component.componentName
-    elif isinstance(component, tuple):
-        if not len(component) == 2:
-            raise ValueError('expected two-tuple with two elements')
-        component = component[0]
     if not isinstance(component, str):
-        raise ValueError(component)
+        if not (component_name_getter := _component_name_getters.get(type(component))):
+            # fallback for subclasses of types above
+            component_name_getter = next((
+                getter for component_type, getter in _component_name_getters.items()
+                if isinstance(component, component_type)
+            ), None)
+
+        if component_name_getter:
+            component = component_name_getter(component)
+
+        if not isinstance(component, str):
+            raise ValueError(component)
 
     if ':' in component:
         # assumption: has form <name>:<version>
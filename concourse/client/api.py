@@ -177,6 +177,11 @@ class ConcourseApiBase:
         response = self._get(pipelines_url)
         return map(select_attr('name'), response)
 
+    def exposed_pipelines(self):
+        pipelines_url = self.routes.pipelines()
+        response = self._get(pipelines_url)
+        return (pipeline['name'] for pipeline in response if pipeline.get('public'))
+
     def order_pipelines(self, pipeline_names):
         url = self.routes.order_pipelines()
         self._put(url, json.dumps(pipeline_names))
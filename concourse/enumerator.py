@@ -527,7 +527,8 @@ class DefinitionDescriptor:
 
 class TemplateRetriever:
     '''
-    Provides mako templates by name. Templates are cached.
+    Provides mako templates by name. Templates are cached (also across instances, as e.g. the
+    webhook-dispatcher creates a retriever per request).
     '''
 
     def __init__(
@@ -537,24 +538,37 @@ class TemplateRetriever:
         if type(template_path) == str:
             self.template_path = (template_path,)
         else:
-            self.template_path = template_path
+            self.template_path = tuple(template_path)
 
-    @functools.lru_cache()
     def template_file(self, template_name):
-        # TODO: do not hard-code file name extension
-        template_file_name = template_name + '.mako'
-        for path in self.template_path:
-            for dirpath, _, filenames in os.walk(path):
-                if template_file_name in filenames:
-                    return os.path.join(dirpath, template_file_name)
-        fail(
-            'could not find template {t}, tried in {p}'.format(
-                t=str(template_name),
-                p=','.join(map(str, self.template_path))
-            )
+        return _template_file(
+            template_path=self.template_path,
+            template_name=template_name,
         )
 
-    @functools.lru_cache()
     def template_contents(self, template_name='default'):
-        with open(self.template_file(template_name=template_name)) as f:
-            return f.read()
+        return _template_contents(
+            template_file=self.template_file(template_name=template_name),
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _template_file(template_path: tuple[str, ...], template_name: str) -> str:
+    # TODO: do not hard-code file name extension
+    template_file_name = template_name + '.mako'
+    for path in template_path:
+        for dirpath, _, filenames in os.walk(path):
+            if template_file_name in filenames:
+                return os.path.join(dirpath, template_file_name)
+    fail(
+        'could not find template {t}, tried in {p}'.format(
+            t=str(template_name),
+            p=','.join(map(str, template_path))
+        )
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _template_contents(template_file: str) -> str:
+    with open(template_file) as f:
+        return f.read()
@@ -2,6 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
+import dataclasses
+import functools
+import operator
+import sys
 import typing
 
 from abc import abstractmethod
@@ -31,31 +36,64 @@ EnumValueWithDocumentation = namedtuple('EnumValueWithDocumentation', ['value',
 
 
 class AttribSpecMixin:
+    __slots__ = ('raw',)
+
     @classmethod
     def _attribute_specs(cls):
         raise NotImplementedError
 
     @classmethod
     def _defaults_dict(cls):
-        return AttributeSpec.defaults_dict(cls._attribute_specs())
+        return dict(_attr_names_and_defaults_for_type(cls, RequiredPolicy.OPTIONAL))
 
     @classmethod
     def _optional_attributes(cls):
-        return set(AttributeSpec.optional_attr_names(cls._attribute_specs())) | \
-            set(AttributeSpec.deprecated_attr_names(cls._attribute_specs()))
+        return {
+            name for name, _ in _attr_names_and_defaults_for_type(cls, RequiredPolicy.OPTIONAL)
+        } | {
+            name for name, _ in _attr_names_and_defaults_for_type(cls, RequiredPolicy.DEPRECATED)
+        }
 
     @classmethod
     def _required_attributes(cls):
-        return set(AttributeSpec.required_attr_names(cls._attribute_specs()))
+        return {
+            name for name, _ in _attr_names_and_defaults_for_type(cls, RequiredPolicy.REQUIRED)
+        }
 
     def _apply_defaults(self, raw_dict):
-        self.raw = ci.util.merge_dicts(
-            self._defaults_dict(),
-            raw_dict,
+        self.raw = _merge_defaults(
+            defaults=self._defaults_dict(),
+            raw_dict=raw_dict,
         )
 
 
+def _merge_defaults(defaults: dict, raw_dict: dict) -> dict:
+    '''
+    equivalent to `ci.util.merge_dicts(defaults, raw_dict)` (i.e. deep-merging copies of passed
+    dicts; lists are merged by appending absent elements from `raw_dict`), but w/o the overhead
+    of setting up a `deepmerge.Merger` (which is significant, as this is done for each model
+    element)
+    '''
+    def merge(base: dict, other: dict) -> dict:
+        for key, value in other.items():
+            if key in base:
+                base_value = base[key]
+                if isinstance(base_value, list) and isinstance(value, list):
+                    value = base_value + [e for e in value if e not in base_value]
+                elif isinstance(base_value, dict) and isinstance(value, dict):
+                    value = merge(base_value, value)
+            base[key] = value
+        return base
+
+    return merge(
+        copy.deepcopy(defaults),
+        copy.deepcopy(ci.util.not_none(raw_dict)),
+    )
+
+
 class ModelBase(AttribSpecMixin, ModelValidationMixin):
+    __slots__ = ()
+
     def __init__(self, raw_dict: dict):
         ci.util.not_none(raw_dict)
 
@@ -75,14 +113,22 @@ class RequiredPolicy(Enum):
     DEPRECATED = 'deprecated'
 
 
+# eq=False -> hash by identity (defaults may be unhashable)
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
 class AttributeSpec:
+    name: str
+    doc: str
+    default: typing.Any = None
+    required_policy: RequiredPolicy | None = None
+    type: typing.Any = str
+
     @staticmethod
     def optional(name, doc, default, *args, **kwargs):
         return AttributeSpec(
             name=name,
             doc=doc,
             default=default,
-            required=RequiredPolicy.OPTIONAL,
+            required_policy=RequiredPolicy.OPTIONAL,
             *args,
             **kwargs,
         )
@@ -92,7 +138,7 @@ class AttributeSpec:
         return AttributeSpec(
             name=name,
             doc=doc,
-            required=RequiredPolicy.REQUIRED,
+            required_policy=RequiredPolicy.REQUIRED,
             *args,
             **kwargs,
         )
@@ -102,114 +148,102 @@ class AttributeSpec:
         return AttributeSpec(
             name=name,
             doc=doc,
-            required=RequiredPolicy.DEPRECATED,
+            required_policy=RequiredPolicy.DEPRECATED,
             *args,
             **kwargs,
         )
 
     @staticmethod
     def filter_attrs(attrs: 'typing.Iterable[AttributeSpec]', required: RequiredPolicy):
-        if required:
-            ci.util.check_type(required, RequiredPolicy)
-        else:
+        if not required:
             # no filtering
             yield from attrs
+            return
+
+        ci.util.check_type(required, RequiredPolicy)
 
         for attr in attrs:
-            ci.util.check_type(attr, AttributeSpec)
-            if attr.required_policy() is required:
+            if attr.required_policy is required:
                 yield attr
 
     @staticmethod
     def select_name(attr):
         ci.util.check_type(attr, AttributeSpec)
-        return attr.name()
+        return attr.name
 
     @staticmethod
     def select_name_and_default(attr):
         ci.util.check_type(attr, AttributeSpec)
-        return attr.name(), attr.default_value()
+        return attr.name, attr.default
 
     @staticmethod
     def required_attr_names(attrs: 'typing.Iterable[AttributeSpec]'):
-        yield from map(
-            AttributeSpec.select_name,
-            AttributeSpec.filter_attrs(attrs=attrs, required=RequiredPolicy.REQUIRED)
+        yield from (
+            name for name, _ in _attr_names_and_defaults(attrs, RequiredPolicy.REQUIRED)
         )
 
     @staticmethod
     def optional_attr_names(attrs: 'typing.Iterable[AttributeSpec]'):
-        yield from map(
-            AttributeSpec.select_name,
-            AttributeSpec.filter_attrs(attrs=attrs, required=RequiredPolicy.OPTIONAL)
+        yield from (
+            name for name, _ in _attr_names_and_defaults(attrs, RequiredPolicy.OPTIONAL)
         )
 
     @staticmethod
     def deprecated_attr_names(attrs: 'typing.Iterable[AttributeSpec]'):
-        return {
-            name: value for name, value in map(
-                AttributeSpec.select_name_and_default,
-                AttributeSpec.filter_attrs(attrs, required=RequiredPolicy.DEPRECATED,
-                )
-            )
-        }
+        return dict(_attr_names_and_defaults(attrs, RequiredPolicy.DEPRECATED))
 
     @staticmethod
     def defaults_dict(attrs: 'typing.Iterable[AttributeSpec]'):
-        return {
-            name: value for name, value in map(
-                AttributeSpec.select_name_and_default,
-                AttributeSpec.filter_attrs(attrs, required=RequiredPolicy.OPTIONAL,
-                )
-            )
-        }
+        return dict(_attr_names_and_defaults(attrs, RequiredPolicy.OPTIONAL))
 
-    def __init__(
-        self,
-        name: str,
-        doc: str,
-        default=None,
-        required=None,
-        type=str,
-    ):
-        self._name = ci.util.check_type(name, str)
-        self._doc = ci.util.check_type(doc, str)
-        self._type = type
+    def __post_init__(self):
+        ci.util.check_type(self.name, str)
+        ci.util.check_type(self.doc, str)
+        # names are used as keys for lookups in model elements' raw dicts
+        object.__setattr__(self, 'name', sys.intern(self.name))
 
         # validate
-        if default:
-            if required and required not in (RequiredPolicy.OPTIONAL, RequiredPolicy.DEPRECATED):
+        if self.default:
+            if self.required_policy and self.required_policy not in (
+                RequiredPolicy.OPTIONAL,
+                RequiredPolicy.DEPRECATED,
+            ):
                 raise ValueError()
 
-        self._required_policy = required
-        self._default_value = default
-
-    def name(self) -> str:
-        return self._name
-
-    def doc(self) -> str:
-        return self._doc
-
-    def default_value(self):
-        return self._default_value
-
-    def type(self) -> type:
-        return self._type
-
-    def required_policy(self):
-        return self._required_policy
-
     def is_required(self):
-        if self.required_policy() == RequiredPolicy.REQUIRED:
+        if self.required_policy == RequiredPolicy.REQUIRED:
             return True
-        elif self.required_policy() == RequiredPolicy.OPTIONAL:
+        elif self.required_policy == RequiredPolicy.OPTIONAL:
             return False
-        elif self.required_policy() == RequiredPolicy.DEPRECATED:
+        elif self.required_policy == RequiredPolicy.DEPRECATED:
             return False
         raise NotImplementedError
 
 
+def _attr_names_and_defaults(
+    attrs: 'typing.Iterable[AttributeSpec]',
+    required: RequiredPolicy,
+) -> tuple[tuple[str, typing.Any], ...]:
+    return tuple(
+        map(
+            AttributeSpec.select_name_and_default,
+            AttributeSpec.filter_attrs(attrs, required=required),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _attr_names_and_defaults_for_type(
+    model_type: type[AttribSpecMixin],
+    required: RequiredPolicy,
+) -> tuple[tuple[str, typing.Any], ...]:
+    # attribute-specs are defined per model-type (some types create them on each invocation)
+    return _attr_names_and_defaults(model_type._attribute_specs(), required)
+
+
 class Trait(ModelBase):
+    __slots__ = ('name', 'variant_name', 'cfg_set')
+
     def __init__(
         self,
         name: str,
@@ -227,10 +261,12 @@ class Trait(ModelBase):
         raise NotImplementedError
 
     def __str__(self):
-        return 'Trait: {n}'.format(n=self.name)
+        return f'Trait: {self.name}'
 
 
 class TraitTransformer:
+    __slots__ = ()
+
     name = None # subclasses must overwrite
 
     def __init__(self):
@@ -258,16 +294,16 @@ class ScriptType(Enum):
 
 
 def normalise_to_dict(dictish):
-    if type(dictish) == str:
+    if isinstance(dictish, dict):
+        return dictish # most common case
+    if isinstance(dictish, str):
         return {dictish: {}}
-    if type(dictish) == list:
-        values = []
-        for v in dictish:
-            if type(v) == dict and v:
-                values.append(v.popitem())
-            elif type(v) != dict:
-                values.append((v, {}))
-        return dict(values)
+    if isinstance(dictish, list):
+        return dict(
+            v.popitem() if isinstance(v, dict) else (v, {})
+            for v in dictish
+            if v or not isinstance(v, dict) # skip empty dicts
+        )
     return dictish
 
 
@@ -276,4 +312,4 @@ def fail(msg):
 
 
 def select_attr(name):
-    return lambda o: o.name
+    return operator.attrgetter(name)
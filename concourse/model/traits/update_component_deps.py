@@ -4,6 +4,8 @@
 
 
 import enum
+import functools
+import operator
 import re
 import typing
 
@@ -24,7 +26,6 @@ from concourse.model.job import (
 )
 from model.base import ModelValidationError
 
-import concourse.model.traits.component_descriptor
 import concourse.model.traits.images
 import ocm
 
@@ -47,6 +48,27 @@ class UpstreamUpdatePolicy(enum.Enum):
     ACCEPT_HOTFIXES = 'accept_hotfixes'
 
 
+def _enum_member_lookup(enum_type: type[enum.Enum]) -> typing.Callable[[typing.Any], enum.Enum]:
+    '''
+    returns a callable equivalent to `enum_type(value)`, w/ a (cheaper) dict-lookup for known
+    values (falling back to enum's lookup, e.g. for members or invalid values)
+    '''
+    members_by_value = {member.value: member for member in enum_type}
+
+    def lookup(value):
+        try:
+            return members_by_value[value]
+        except (KeyError, TypeError):
+            return enum_type(value)
+
+    return lookup
+
+
+_merge_policy = _enum_member_lookup(MergePolicy)
+_merge_method = _enum_member_lookup(MergeMethod)
+_upstream_update_policy = _enum_member_lookup(UpstreamUpdatePolicy)
+
+
 MERGE_POLICY_CONFIG_ATTRIBUTES = (
     AttributeSpec.optional(
         name='component_names',
@@ -80,6 +102,9 @@ class MergePolicyConfig(ModelBase):
     def _attribute_specs(cls):
         return MERGE_POLICY_CONFIG_ATTRIBUTES
 
+    def custom_init(self, raw_dict: dict):
+        self._component_name_patterns = None # lazily compiled (see component_name_patterns)
+
     def component_names(self):
         # handle default here
         # TODO: refactor default arg handling. User-given values should *replace* defaults, not
@@ -89,11 +114,63 @@ class MergePolicyConfig(ModelBase):
 
         return self.raw['component_names']
 
+    def component_name_patterns(self) -> tuple[re.Pattern, ...]:
+        if self._component_name_patterns is None:
+            self._component_name_patterns = tuple(
+                re.compile(component_name) for component_name in self.component_names()
+            )
+
+        return self._component_name_patterns
+
     def merge_mode(self):
-        return MergePolicy(self.raw['merge_mode'])
+        return _merge_policy(self.raw['merge_mode'])
 
     def merge_method(self):
-        return MergeMethod(self.raw['merge_method'])
+        return _merge_method(self.raw['merge_method'])
+
+
+# default (used if no merge-policies are configured); shared, as it is never modified
+_default_merge_policy_config = MergePolicyConfig({
+    'component_names': ['.*'],
+    'merge_mode': 'manual',
+    'merge_method': 'merge',
+})
+
+
+_component_name_getters = {
+    ocm.Component: operator.attrgetter('name'),
+    ocm.ComponentIdentity: operator.attrgetter('name'),
+    ocm.ComponentReference: operator.attrgetter('componentName'),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _combine_component_name_patterns(
+    component_names_by_policy: tuple[tuple[str, ...], ...],
+) -> re.Pattern | None:
+    '''
+    returns a single pattern combining all component-name patterns of all policies as
+    alternatives (in order), each wrapped in a named group (`p<policy-idx>_<pattern-idx>`),
+    thus allowing to find the matching policy w/ one match. Returns None if combining is not
+    possible (e.g. for patterns containing groups themselves, as backreferences would break).
+
+    memoised, as typically, many pipeline-definitions share the same merge-policies
+    '''
+    patterns = [
+        (policy_idx, pattern_idx, re.compile(component_name))
+        for policy_idx, component_names in enumerate(component_names_by_policy)
+        for pattern_idx, component_name in enumerate(component_names)
+    ]
+    if not patterns or any(pattern.groups for _, _, pattern in patterns):
+        return None
+
+    try:
+        return re.compile('|'.join(
+            f'(?P<p{policy_idx}_{pattern_idx}>{pattern.pattern})'
+            for policy_idx, pattern_idx, pattern in patterns
+        ))
+    except re.error:
+        return None # e.g. global flags (only allowed at start of pattern)
 
 
 class MergePolicies:
@@ -102,18 +179,65 @@ class MergePolicies:
         policies: list[MergePolicyConfig],
     ):
         self.policies = policies
+        self._combined_pattern = None # lazily initialised (see _combined_component_name_pattern)
+        self._policy_lookup = None # lazily initialised (see _literal_policy_lookup)
+
+    def _literal_policy_lookup(
+        self,
+    ) -> tuple[dict[str, MergePolicyConfig], MergePolicyConfig | None] | None:
+        '''
+        returns a mapping of component-names to (first) matching policies, plus the policy
+        matching all component-names (if any), if all component-name patterns are either
+        literal names, or match any name (`.*`, which is the default). Otherwise, returns None,
+        in which case regular expressions must be used for finding policies.
+        '''
+        if self._policy_lookup is None:
+            policies_by_component_name = {}
+            fallback_policy = None
+            for policy in self.policies:
+                for component_name in policy.component_names():
+                    if component_name == '.*':
+                        fallback_policy = policy
+                        break
+                    if re.escape(component_name) != component_name:
+                        self._policy_lookup = False
+                        return None
+                    policies_by_component_name.setdefault(component_name, policy)
+                if fallback_policy:
+                    break # all subsequent policies are unreachable
+            self._policy_lookup = (policies_by_component_name, fallback_policy)
+
+        return self._policy_lookup or None
+
+    def _combined_component_name_pattern(self) -> re.Pattern | None:
+        '''
+        returns a single pattern combining all component-name patterns of all policies (see
+        `_combine_component_name_patterns`), or None if combining is not possible
+        '''
+        if self._combined_pattern is None:
+            self._combined_pattern = _combine_component_name_patterns(tuple(
+                tuple(policy.component_names()) for policy in self.policies
+            )) or False
+
+        return self._combined_pattern or None
 
     def find_policy(self, component) -> MergePolicyConfig | None:
-        if isinstance(component, ocm.Component):
-            component = component.name
-        elif isinstance(component, ocm.ComponentIdentity):
-            component = component.name
-        elif isinstance(component, ocm.ComponentReference):
-            component = component.componentName
+        if (component_name_getter := _component_name_getters.get(type(component))):
+            component = component_name_getter(component)
+
+        if (policy_lookup := self._literal_policy_lookup()):
+            policies_by_component_name, fallback_policy = policy_lookup
+            return policies_by_component_name.get(component, fallback_policy)
+
+        if (combined_pattern := self._combined_component_name_pattern()):
+            if not (match := combined_pattern.fullmatch(component)):
+                return None
+            policy_idx, _ = match.lastgroup[1:].split('_')
+            return self.policies[int(policy_idx)]
 
         for policy in self.policies:
-            for cname in policy.component_names():
-                if re.fullmatch(cname, component):
+            for component_name_pattern in policy.component_name_patterns():
+                if component_name_pattern.fullmatch(component):
                     return policy
 
     def merge_policy_for(self, component) -> MergePolicy | None:
@@ -221,37 +345,39 @@ class UpdateComponentDependenciesTrait(Trait):
         return self.raw.get('upstream_component_name')
 
     def upstream_update_policy(self):
-        return UpstreamUpdatePolicy(self.raw.get('upstream_update_policy'))
+        return _upstream_update_policy(self.raw.get('upstream_update_policy'))
+
+    def custom_init(self, raw_dict: dict):
+        self._merge_policies = None # lazily initialised (see merge_policies)
+
+    def merge_policies(self) -> list[MergePolicyConfig]:
+        if self._merge_policies is None:
+            self._merge_policies = self._create_merge_policies()
+
+        return self._merge_policies
+
+    def _create_merge_policies(self) -> list[MergePolicyConfig]:
+        if (merge_policies := self.raw.get('merge_policies')):
+            return [
+                MergePolicyConfig(cfg) for cfg in merge_policies
+            ]
 
-    def merge_policies(self):
         # handle default here
         # TODO: refactor default arg handling. User-given values should *replace* defaults, not
         #       add to them
-        if not self.raw.get('merge_policies'):
-            if not self.raw.get('merge_policy'):
-                return [
-                    MergePolicyConfig({
-                        'component_names': ['.*'],
-                        'merge_mode': 'manual',
-                        'merge_method': 'merge',
-                    })]
-
+        if (merge_policy := self.raw.get('merge_policy')):
             # preserve legacy behaviour
             # TODO rm
-            else:
-                return [
-                    MergePolicyConfig({
-                        'component_names': ['.*'],
-                        'merge_mode': self.raw['merge_policy'],
-                        'merge_method': 'merge',
-                    })
-                ]
-
-        else:
             return [
-                MergePolicyConfig(cfg) for cfg in self.raw['merge_policies']
+                MergePolicyConfig({
+                    'component_names': ['.*'],
+                    'merge_mode': merge_policy,
+                    'merge_method': 'merge',
+                })
             ]
 
+        return [_default_merge_policy_config]
+
     def after_merge_callback(self):
         return self.raw.get('after_merge_callback')
 
@@ -298,13 +424,16 @@ class UpdateComponentDependenciesTraitTransformer(TraitTransformer):
         return {'component_descriptor'}
 
     def inject_steps(self):
+        # deferred, as only needed for rendering (and comparatively expensive to import)
+        import concourse.model.traits.component_descriptor as component_descriptor
+
         if self.trait.set_dependency_version_script_container_image():
             privilege_mode = PrivilegeMode.PRIVILEGED
         else:
             privilege_mode = PrivilegeMode.UNPRIVILEGED
 
         # declare no dependencies --> run asap, but do not block other steps
-        self.update_component_deps_step = PipelineStep(
+        self.update_component_deps_step = step = PipelineStep(
                 name='update_component_dependencies',
                 raw_dict={
                     'privilege_mode': privilege_mode,
@@ -314,26 +443,26 @@ class UpdateComponentDependenciesTraitTransformer(TraitTransformer):
                 injecting_trait_name=self.name,
                 script_type=ScriptType.PYTHON3
         )
-        self.update_component_deps_step.add_input(
-            name=concourse.model.traits.component_descriptor.DIR_NAME,
-            variable_name=concourse.model.traits.component_descriptor.ENV_VAR_NAME,
+        step.add_input(
+            name=component_descriptor.DIR_NAME,
+            variable_name=component_descriptor.ENV_VAR_NAME,
         )
-        self.update_component_deps_step.set_timeout(duration_string='30m')
+        step.set_timeout(duration_string='30m')
 
-        for name, value in self.trait.vars().items():
-            self.update_component_deps_step.variables()[name] = value
+        step.variables().update(self.trait.vars())
 
-        yield self.update_component_deps_step
+        yield step
 
     def process_pipeline_args(self, pipeline_args: JobVariant):
+        import concourse.model.traits.component_descriptor as component_descriptor
+
         # our step depends on dependendency descriptor step
         component_descriptor_step = pipeline_args.step(
-            concourse.model.traits.component_descriptor.DEFAULT_COMPONENT_DESCRIPTOR_STEP_NAME
+            component_descriptor.DEFAULT_COMPONENT_DESCRIPTOR_STEP_NAME
         )
         self.update_component_deps_step._add_dependency(component_descriptor_step)
 
         upstream_component_name = self.trait.upstream_component_name()
         if upstream_component_name:
-            self.update_component_deps_step.variables()['UPSTREAM_COMPONENT_NAME'] = '"{cn}"'.format(
-                cn=upstream_component_name,
-            )
+            self.update_component_deps_step.variables()['UPSTREAM_COMPONENT_NAME'] = \
+                f'"{upstream_component_name}"'
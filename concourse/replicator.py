@@ -1,11 +1,18 @@
+import collections
 import dataclasses
 import enum
 import os
 import random
+import sys
 import time
 
 from enum import Enum, IntEnum
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 import functools
 import logging
 import textwrap
@@ -116,6 +123,26 @@ def _cc_utils_version():
         return None
 
 
+@functools.lru_cache
+def _template_lookup(template_include_dir: str):
+    # share lookup (and thus compiled templates) between renderers
+    from mako.lookup import TemplateLookup
+    return TemplateLookup([template_include_dir])
+
+
+@functools.lru_cache(maxsize=64)
+def _template(
+    template_contents: str,
+    lookup,
+) -> mako.template.Template:
+    '''
+    returns compiled template. Memoised, as typically, many pipelines are rendered from the same
+    template (compiled templates may be rendered concurrently)
+    '''
+    with makoutil.template_lock:
+        return mako.template.Template(template_contents, lookup=lookup) # nosec B702
+
+
 class Renderer:
     def __init__(
         self,
@@ -126,11 +153,16 @@ class Renderer:
     ):
         self.template_retriever = template_retriever
         self.render_origin = render_origin
+        # read upfront (rather than upon first - concurrent - rendering)
+        self.cc_utils_version = _cc_utils_version()
+        if render_origin is RenderOrigin.PIPELINE_REPLICATION:
+            self.replication_pipeline_name = os.environ.get('PIPELINE_NAME')
+        else:
+            self.replication_pipeline_name = None
         if template_include_dir:
             template_include_dir = os.path.abspath(template_include_dir)
             self.template_include_dir = os.path.abspath(template_include_dir)
-            from mako.lookup import TemplateLookup
-            self.lookup = TemplateLookup([template_include_dir])
+            self.lookup = _template_lookup(template_include_dir)
             self.cfg_set = cfg_set
 
     def render(
@@ -150,20 +182,22 @@ class Renderer:
                 f"in repository '{definition_descriptor.main_repo.get('path')}' on branch "
                 f"'{definition_descriptor.main_repo.get('branch')}'"
             )
-            traceback.print_exc()
+            # format only once (equivalent to traceback.print_exc)
+            error_details = traceback.format_exc()
+            print(error_details, file=sys.stderr, end='')
             return RenderResult(
                 definition_descriptor,
                 render_status=RenderStatus.FAILED,
-                error_details=traceback.format_exc(),
+                error_details=error_details,
                 exception=e,
             )
 
     def _render(self, definition_descriptor):
         effective_definition = definition_descriptor.pipeline_definition
 
-        # handle inheritance
-        for override in definition_descriptor.override_definitions:
-            effective_definition = merge_dicts(effective_definition, override)
+        # handle inheritance (typically, some overrides are empty)
+        if (overrides := [o for o in definition_descriptor.override_definitions if o]):
+            effective_definition = merge_dicts(effective_definition, *overrides)
 
         template_name = definition_descriptor.template_name()
         template_contents = self.template_retriever.template_contents(template_name)
@@ -188,17 +222,14 @@ class Renderer:
             'secret_cfg': definition_descriptor.secret_cfg,
             'job_mapping': definition_descriptor.job_mapping,
             'render_origin': self.render_origin.value,
-            'cc_utils_version': _cc_utils_version(),
+            'cc_utils_version': self.cc_utils_version,
             'pipeline_definition_committish': definition_descriptor.pipeline_definition_committish,
         }
 
         # also pass pipeline name if this was rendered by a replication job. Will be printed
         # in the meta-step later
-        if (
-            self.render_origin is RenderOrigin.PIPELINE_REPLICATION
-            and (pipeline_name := os.environ.get('PIPELINE_NAME'))
-        ):
-            pipeline_metadata['replication_pipeline_name'] = pipeline_name
+        if self.replication_pipeline_name:
+            pipeline_metadata['replication_pipeline_name'] = self.replication_pipeline_name
 
         if bg := effective_definition.get('background_image'):
             pipeline_metadata['background_image'] = bg
@@ -208,10 +239,9 @@ class Renderer:
                 raise RuntimeError(
                     f"No main repository for pipeline definition {pipeline_definition.name}."
                 )
-            pipeline_metadata['pipeline_name'] = definition_descriptor.effective_pipeline_name()
+        pipeline_metadata['pipeline_name'] = definition_descriptor.effective_pipeline_name()
 
-        with makoutil.template_lock:
-            template = mako.template.Template(template_contents, lookup=self.lookup) # nosec B702
+        template = _template(template_contents, lookup=self.lookup)
 
         try:
             definition_descriptor.pipeline = template.render(
@@ -314,6 +344,57 @@ class ConcourseDeployer(DefinitionDeployer):
         self.unpause_new_pipelines = unpause_new_pipelines
         self.expose_pipelines = expose_pipelines
 
+        # names of exposed pipelines, keyed by concourse target (retrieved lazily)
+        self._exposed_pipeline_names = {}
+        self._exposed_pipeline_names_lock = threading.Lock()
+
+    def _pipeline_exposed(
+        self,
+        api: concourse.client.api.ConcourseApiBase,
+        concourse_target_key,
+        pipeline_name: str,
+    ) -> bool:
+        exposed_pipeline_names = self._exposed_pipeline_names.get(concourse_target_key)
+
+        if exposed_pipeline_names is None:
+            # retrieve w/o holding lock, so deployments to other (or the same) concourse targets
+            # are not blocked; concurrent retrievals for same target are harmless (first one wins)
+            exposed_pipeline_names = set(api.exposed_pipelines())
+
+            with self._exposed_pipeline_names_lock:
+                exposed_pipeline_names = self._exposed_pipeline_names.setdefault(
+                    concourse_target_key,
+                    exposed_pipeline_names,
+                )
+
+        return pipeline_name in exposed_pipeline_names
+
+    def _set_pipeline(
+        self,
+        api: concourse.client.api.ConcourseApiBase,
+        pipeline_name: str,
+        pipeline_definition: str,
+        max_retries: int=3,
+    ) -> concourse.client.model.SetPipelineResult:
+        for attempt in range(max_retries + 1):
+            try:
+                return api.set_pipeline(
+                    name=pipeline_name,
+                    pipeline_definition=pipeline_definition
+                )
+            except requests.exceptions.HTTPError as e:
+                # We sometimes see this non-descript error. According to an old Concourse-Issue
+                # this might happen due to concurrent saves. Wait (w/ exponential backoff and
+                # jitter) and try again.
+                err_content = (
+                    b'failed to save config: comparison with existing config failed during save'
+                )
+                if attempt == max_retries or not (
+                    e.response.status_code == 500 and e.response.content == err_content
+                ):
+                    raise
+                time.sleep(min(30, 2 ** attempt + random.random()))
+
     def deploy(
         self,
         definition_descriptor: DefinitionDescriptor,
@@ -328,25 +409,11 @@ class ConcourseDeployer(DefinitionDeployer):
                 team_name=definition_descriptor.concourse_target_team,
             )
 
-            try:
-                response = api.set_pipeline(
-                    name=pipeline_name,
-                    pipeline_definition=pipeline_definition
-                )
-            except requests.exceptions.HTTPError as e:
-                # We sometimes see this non-descript error. According to an old Concourse-Issue
-                # this might happen due to concurrent saves. Wait a random time and try again.
-                err_content = (
-                    b'failed to save config: comparison with existing config failed during save'
-                )
-                if e.response.status_code == 500 and e.response.content == err_content:
-                    time.sleep(random.randrange(5,30))
-                    response = api.set_pipeline(
-                        name=pipeline_name,
-                        pipeline_definition=pipeline_definition
-                    )
-                else:
-                    raise
+            response = self._set_pipeline(
+                api=api,
+                pipeline_name=pipeline_name,
+                pipeline_definition=pipeline_definition,
+            )
 
             logger.info(
                 'Deployed pipeline: ' + pipeline_name +
@@ -361,7 +428,14 @@ class ConcourseDeployer(DefinitionDeployer):
                 logger.info(f'Unpausing new {pipeline_name=}')
                 api.unpause_pipeline(pipeline_name=pipeline_name)
 
-            if self.expose_pipelines:
+            if self.expose_pipelines and (
+                response is SetPipelineResult.CREATED
+                or not self._pipeline_exposed(
+                    api=api,
+                    concourse_target_key=definition_descriptor.concourse_target_key(),
+                    pipeline_name=pipeline_name,
+                )
+            ):
                 api.expose_pipeline(pipeline_name=pipeline_name)
 
             deploy_status = DeployStatus.SUCCEEDED
@@ -377,16 +451,35 @@ class ConcourseDeployer(DefinitionDeployer):
                 deploy_status=deploy_status,
             )
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            error_details = traceback.format_exc()
+            print(error_details, file=sys.stderr, end='')
             logger.warning(e)
             return DeployResult(
                 definition_descriptor=definition_descriptor,
                 deploy_status=DeployStatus.FAILED,
-                error_details=traceback.format_exc(),
+                error_details=error_details,
             )
 
 
+# if one of those exceptions was raised, presumably, there was either a (hopefully) transient
+# issue (e.g. network connectivity), or a programming error in our template (in which case we
+# should not bother end-users)
+_ignored_exception_types = frozenset((
+    ArithmeticError,
+    AttributeError,
+    BufferError,
+    EOFError,
+    ImportError,
+    MemoryError,
+    NameError,
+    OSError,
+    ReferenceError,
+    RecursionError,
+    SyntaxError,
+    TypeError,
+))
+
+
 class ReplicationResultProcessor:
     def __init__(
         self,
@@ -415,19 +508,17 @@ class ReplicationResultProcessor:
 
     def process_results(self, results):
         # collect pipelines by concourse target (concourse_cfg, team_name) as key
-        concourse_target_results = {}
+        # also evaluate results
+        concourse_target_results = collections.defaultdict(list)
+        failed_descriptors = []
         for result in results:
             definition_descriptor = result.definition_descriptor
             concourse_target_key = definition_descriptor.concourse_target_key()
-            if concourse_target_key not in concourse_target_results:
-                concourse_target_results[concourse_target_key] = []
             concourse_target_results[concourse_target_key].append(result)
 
-        # evaluate results
-        failed_descriptors = [
-            d for d in results
-            if not d.deploy_status & DeployStatus.SUCCEEDED
-        ]
+            if not result.deploy_status & DeployStatus.SUCCEEDED:
+                failed_descriptors.append(result)
+
         failed_count = len(failed_descriptors)
 
         if failed_count > 0:
@@ -447,13 +538,20 @@ class ReplicationResultProcessor:
                 team_name=concourse_team,
             )
 
+            if self.remove_pipelines or self.reorder_pipelines:
+                # in current order
+                existing_pipeline_names = list(concourse_api.pipelines())
+            else:
+                existing_pipeline_names = []
+            pipelines_to_remove = set()
+
             # find pipelines to remove
             if self.remove_pipelines:
                 deployed_pipeline_names = set(map(
                     lambda r: r.definition_descriptor.pipeline_name, concourse_results
                 ))
 
-                pipelines_to_remove = set(concourse_api.pipelines()) - deployed_pipeline_names
+                pipelines_to_remove = set(existing_pipeline_names) - deployed_pipeline_names
 
                 if self.remove_pipelines_filter:
                     logger.info(f'before applying filter: {pipelines_to_remove=}')
@@ -463,17 +561,26 @@ class ReplicationResultProcessor:
                     }
                     logger.info(f'after applying filter: {pipelines_to_remove=}')
 
-                for pipeline_name in pipelines_to_remove:
+                def remove_pipeline(pipeline_name: str):
                     logger.info('removing pipeline: {p}'.format(p=pipeline_name))
                     concourse_api.delete_pipeline(pipeline_name)
 
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    # consume results so that errors are raised
+                    for _ in executor.map(remove_pipeline, pipelines_to_remove):
+                        pass
+
             # trigger resource checks in new pipelines
             self._initialise_new_pipeline_resources(concourse_api, concourse_results)
             if self.reorder_pipelines:
-                # order pipelines alphabetically
-                pipeline_names = list(concourse_api.pipelines())
-                pipeline_names.sort()
-                concourse_api.order_pipelines(pipeline_names)
+                # order pipelines alphabetically (pipelines were deployed before retrieving
+                # existing pipelines, so no need to re-retrieve)
+                pipeline_names = [
+                    name for name in existing_pipeline_names
+                    if name not in pipelines_to_remove
+                ]
+                if (sorted_pipeline_names := sorted(pipeline_names)) != pipeline_names:
+                    concourse_api.order_pipelines(sorted_pipeline_names)
 
         logger.info('Successfully replicated {d} pipeline(s)'.format(d=len(results) - failed_count))
 
@@ -489,30 +596,14 @@ class ReplicationResultProcessor:
                 logger.warning(f'will not notify (no err): {pipeline_name=}')
                 return False
 
-            # if one of those exceptions was raised, presumably, there was either a
-            # (hopefully) transient issue (e.g. network connectivity), or a programming error
-            # in our template (in which case we should not bother end-users)
-            ignore_exceptions = (
-                ArithmeticError,
-                AttributeError,
-                BufferError,
-                EOFError,
-                ImportError,
-                MemoryError,
-                NameError,
-                OSError,
-                ReferenceError,
-                RecursionError,
-                SyntaxError,
-                TypeError,
-            )
-
-            if type(deploy_result.definition_descriptor.exception) in ignore_exceptions:
+            if type(deploy_result.definition_descriptor.exception) in _ignored_exception_types:
                 return False
             else:
                 return True
 
         all_notifications_succeeded = True
+        # failures are typically clustered by repository (e.g. many pipelines of one branch)
+        recipients_cache = {}
         for failed_descriptor in failed_descriptors:
             logger.warning(failed_descriptor.definition_descriptor.pipeline_name)
             failed_descriptor: DeployResult
@@ -526,7 +617,10 @@ class ReplicationResultProcessor:
                 )
                 continue
             try:
-                self._notify_broken_definition_owners(failed_descriptor)
+                self._notify_broken_definition_owners(
+                    failed_descriptor=failed_descriptor,
+                    recipients_cache=recipients_cache,
+                )
             except Exception:
                 logger.warning('an error occurred whilst trying to send error notifications')
                 traceback.print_exc()
@@ -535,9 +629,55 @@ class ReplicationResultProcessor:
         # signall error only if error notifications failed
         return all_notifications_succeeded
 
-    def _notify_broken_definition_owners(self, failed_descriptor):
+    def _notify_broken_definition_owners(
+        self,
+        failed_descriptor,
+        recipients_cache: dict[tuple[str, str, str], set[str]]=None,
+    ):
+        '''
+        @param recipients_cache: optional cache of notification-recipients, keyed by
+            (hostname, path, branch) of main repository
+        '''
         definition_descriptor = failed_descriptor.definition_descriptor
         main_repo = definition_descriptor.main_repo
+
+        if recipients_cache is None:
+            recipients = self._notification_recipients(main_repo=main_repo)
+        else:
+            cache_key = (main_repo['hostname'], main_repo['path'], main_repo['branch'])
+            if (recipients := recipients_cache.get(cache_key)) is None:
+                recipients = self._notification_recipients(main_repo=main_repo)
+                recipients_cache[cache_key] = recipients
+
+        # if there are still no recipients available print a warning
+        if not recipients:
+            logger.warning(textwrap.dedent(
+                f"""
+                Unable to determine recipient for pipeline '{definition_descriptor.pipeline_name}'
+                found in branch '{main_repo['branch']}' ({main_repo['path']}). Please make sure that
+                CODEOWNERS and committers have exposed a public e-mail address in their profile.
+                """
+            ))
+        else:
+            logger.info(f'Sending notification e-mail to {recipients} ({main_repo["path"]})')
+            email_cfg = self._cfg_set.email()
+            _send_mail(
+                email_cfg=email_cfg,
+                recipients=recipients,
+                subject='Your pipeline definition in {repo} is erroneous'.format(
+                    repo=main_repo['path'],
+                ),
+                mail_template=textwrap.dedent(
+                f'''
+                    The pipeline definition for {definition_descriptor.pipeline_name=}
+                    on {main_repo["branch"]=} failed to be rendered.
+                    Error details:
+                    {str(failed_descriptor.error_details)}
+                '''
+                ),
+            )
+
+    def _notification_recipients(self, main_repo: dict) -> set[str]:
         repo_owner, repo_name = main_repo['path'].split('/')
         repo_url = urljoin(main_repo['hostname'], repo_owner, repo_name)
         github_cfg = ccc.github.github_cfg_for_repo_url(
@@ -571,33 +711,7 @@ class ReplicationResultProcessor:
                 if user.email:
                     recipients.add(user.email)
 
-        # if there are still no recipients available print a warning
-        if not recipients:
-            logger.warning(textwrap.dedent(
-                f"""
-                Unable to determine recipient for pipeline '{definition_descriptor.pipeline_name}'
-                found in branch '{main_repo['branch']}' ({main_repo['path']}). Please make sure that
-                CODEOWNERS and committers have exposed a public e-mail address in their profile.
-                """
-            ))
-        else:
-            logger.info(f'Sending notification e-mail to {recipients} ({main_repo["path"]})')
-            email_cfg = self._cfg_set.email()
-            _send_mail(
-                email_cfg=email_cfg,
-                recipients=recipients,
-                subject='Your pipeline definition in {repo} is erroneous'.format(
-                    repo=main_repo['path'],
-                ),
-                mail_template=textwrap.dedent(
-                f'''
-                    The pipeline definition for {definition_descriptor.pipeline_name=}
-                    on {main_repo["branch"]=} failed to be rendered.
-                    Error details:
-                    {str(failed_descriptor.error_details)}
-                '''
-                ),
-            )
+        return recipients
 
     def _initialise_new_pipeline_resources(
         self,
@@ -609,7 +723,7 @@ class ReplicationResultProcessor:
             if result.deploy_status & DeployStatus.CREATED
         ]
 
-        for pipeline_name in newly_deployed_pipeline_names:
+        def initialise_pipeline_resources(pipeline_name: str):
             if self.unpause_new_pipelines:
                 logger.info(f'unpausing new {pipeline_name=}')
                 concourse_api.unpause_pipeline(pipeline_name)
@@ -623,6 +737,10 @@ class ReplicationResultProcessor:
                     resource_name=pipeline_config_resource.name,
                 )
 
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for _ in executor.map(initialise_pipeline_resources, newly_deployed_pipeline_names):
+                pass
+
 
 class PipelineValidationError(Exception):
     pass
@@ -664,8 +782,12 @@ class PipelineReplicator:
         self._pipeline_names = set()
 
     def _pipeline_name_conflict(self, definition_descriptor:DefinitionDescriptor):
+        pipeline_name = definition_descriptor.pipeline_name
+        # membership-tests on sets are atomic -> only lock for adding (and re-check)
+        if pipeline_name in self._pipeline_names:
+            return True
+
         with self._pipeline_names_lock:
-            pipeline_name = definition_descriptor.pipeline_name
             if pipeline_name in self._pipeline_names:
                 return True
             self._pipeline_names.add(pipeline_name)
@@ -709,12 +831,28 @@ class PipelineReplicator:
             )
         return deploy_result
 
-    def _replicate(self):
-        executor = ThreadPoolExecutor(max_workers=16)
-        yield from executor.map(
-            self._process_definition_descriptor,
-            self._enumerate_definitions(),
-        )
+    def _replicate(self, max_pending: int=64):
+        '''
+        yields deploy-results in order of completion (rather than in order of enumeration), so
+        slow definitions do not delay results of subsequent ones
+
+        definitions are processed while (still) being enumerated; enumeration is paused while
+        `max_pending` definitions are pending (to bound memory-usage)
+        '''
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            pending = set()
+            for definition_descriptor in self._enumerate_definitions():
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+                pending.add(
+                    executor.submit(self._process_definition_descriptor, definition_descriptor)
+                )
+
+            for future in as_completed(pending):
+                yield future.result()
 
     def replicate(self):
         results = [
@@ -61,8 +61,9 @@ class CtxCfg:
 
         return iter_ocm_repositories
 
-    @property
+    @functools.cached_property
     def ocm_lookup(self) -> 'cnudie.retrieve.ComponentDescriptorLookupById | None':
+        # cached, so clients (and caches of returned lookup) are shared between callers
         if not self.ocm_repository_lookup:
             return None
 
@@ -117,14 +117,14 @@ class AttributesDocumentation:
         return str(default_value)
 
     def _attr_spec_to_table_row(self, attr_spec, prefix=None):
-        name = attr_spec.name()
+        name = attr_spec.name
         required = 'yes' if attr_spec.is_required() else 'no'
 
-        default_value = self._default_value(attr_spec.default_value())
+        default_value = self._default_value(attr_spec.default)
 
-        doc = textwrap.dedent(attr_spec.doc())
+        doc = textwrap.dedent(attr_spec.doc)
 
-        type_ = attr_spec.type()
+        type_ = attr_spec.type
         type_str = self._type_name(type_)
         if dataclasses.is_dataclass(type_):
             self.add_child(
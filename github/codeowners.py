@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
+import functools
 import logging
 import os
 import typing
@@ -196,6 +198,7 @@ def resolve_email_addresses(
     If no email address is exposed the User is skipped.
     '''
     unique_email_addresses = set()
+    unique_usernames = set()
 
     for codeowner_entry in codeowners_entries:
         if isinstance(codeowner_entry, EmailAddress):
@@ -203,24 +206,23 @@ def resolve_email_addresses(
             continue
 
         if isinstance(codeowner_entry, Username):
-            if (email_address := determine_email_address(
-                github_user_name=codeowner_entry,
-                github_api=github_api,
-            )):
-                unique_email_addresses.add(email_address)
-                continue
+            unique_usernames.add(codeowner_entry)
+            continue
 
         if isinstance(codeowner_entry, Team):
-            for email_address in resolve_email_addresses(
-                codeowners_entries=resolve_team_members(
-                    team=codeowner_entry,
-                    github_api=github_api,
-                ),
+            unique_usernames.update(resolve_team_members(
+                team=codeowner_entry,
                 github_api=github_api,
-            ):
-                unique_email_addresses.add(email_address)
+            ))
             continue
 
+    # each lookup is a separate request -> run concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        unique_email_addresses.update(filter(None, executor.map(
+            functools.partial(determine_email_address, github_api=github_api),
+            unique_usernames,
+        )))
+
     yield from unique_email_addresses
 
 
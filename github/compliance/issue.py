@@ -1,4 +1,5 @@
 import datetime
+import functools
 import hashlib
 import logging
 import re
@@ -27,6 +28,7 @@ logger = logging.getLogger(__name__)
 ci.log.configure_default_logging()
 
 
+_label_auto_generated = 'cicd/auto-generated'
 _label_os_outdated = 'os/outdated'
 
 _label_no_responsible = 'cfg/policy-violation/no-responsible'
@@ -61,6 +63,7 @@ def unique_name_for_element(
         return scanned_element.name
 
 
+@functools.lru_cache(maxsize=4096)
 def digest_label(
     prefix: str,
     digest_str: str,
@@ -100,7 +103,7 @@ def _search_labels(
         yield from extra_labels
 
     yield 'area/security'
-    yield 'cicd/auto-generated'
+    yield _label_auto_generated
     yield f'cicd/{issue_type}'
 
     if scanned_element:
@@ -131,15 +134,28 @@ def enumerate_issues(
         extra_labels=extra_labels,
     ))
 
+    yield from _filter_issues(
+        known_issues=known_issues,
+        labels=labels,
+        state=state,
+    )
+
+
+def _filter_issues(
+    known_issues: typing.Iterable[github3.issues.issue.ShortIssue],
+    labels: frozenset[str],
+    state: str | None = None,
+) -> typing.Generator[github3.issues.ShortIssue, None, None]:
     def filter_relevant_issues(issue: github3.issues.issue.ShortIssue):
         # state is of type str, explicitly check for None
         if state != None and issue.state != state:
             return False
 
-        issue_labels = frozenset((l.name for l in issue.original_labels))
-        if not issue_labels & labels == labels:
+        # cheap check first (label-names are unique per issue)
+        if len(issue.original_labels) < len(labels):
             return False
-        return True
+
+        return labels <= frozenset((l.name for l in issue.original_labels))
 
     for issue in filter(filter_relevant_issues, known_issues):
         yield issue
@@ -147,12 +163,10 @@ def enumerate_issues(
 
 @github.retry.retry_and_throttle
 def _create_issue(
-    issue_type: str,
     repository: github3.repos.Repository,
     body: str,
     title: str,
-    scanned_element: gcm.Target=None,
-    extra_labels: typing.Iterable[str]=(),
+    labels: frozenset[str],
     assignees: typing.Iterable[str]=(),
     assignees_statuses: set[delivery.model.Status] = set(),
     milestone: github3.issues.milestone.Milestone=None,
@@ -161,12 +175,6 @@ def _create_issue(
 ) -> github3.issues.issue.ShortIssue:
     assignees = tuple(assignees)
 
-    labels = frozenset(_search_labels(
-        scanned_element=scanned_element,
-        issue_type=issue_type,
-        extra_labels=extra_labels,
-    ))
-
     try:
         issue = repository.create_issue(
             title=title,
@@ -212,12 +220,10 @@ def _create_issue(
 
 @github.retry.retry_and_throttle
 def _update_issue(
-    scanned_element: gcm.Target,
-    issue_type: str,
     body:str,
     title:typing.Optional[str],
     issue: github3.issues.Issue,
-    extra_labels: typing.Iterable[str]=(),
+    labels: frozenset[str],
     milestone: github3.issues.milestone.Milestone=None,
     assignees: typing.Iterable[str]=(),
 ) -> github3.issues.issue.ShortIssue:
@@ -225,19 +231,17 @@ def _update_issue(
     if not issue.assignees and assignees:
         kwargs['assignees'] = tuple(assignees)
 
-    if title:
+    if title and title != issue.title:
         kwargs['title'] = title
 
     if milestone and not issue.milestone:
         kwargs['milestone'] = milestone.number
 
-    labels = sorted(_search_labels(
-        scanned_element=scanned_element,
-        issue_type=issue_type,
-        extra_labels=extra_labels,
-    ))
+    if labels != frozenset(l.name for l in issue.original_labels):
+        kwargs['labels'] = sorted(labels)
 
-    kwargs['labels'] = labels
+    if not kwargs and body == issue.body:
+        return issue # nothing to update
 
     issue.edit(
         body=body,
@@ -311,13 +315,19 @@ def create_or_update_issue(
     preserve_labels_regexes argument are dropped.
     '''
 
+    # labels used for lookup are also assigned to created / updated issue
+    search_labels = frozenset(_search_labels(
+        scanned_element=scanned_element,
+        issue_type=issue_type,
+        extra_labels=ctx_labels,
+    ))
+    extra_labels = frozenset(extra_labels or ())
+
     open_issues = tuple(
-        enumerate_issues(
-            scanned_element=scanned_element,
-            issue_type=issue_type,
+        _filter_issues(
             known_issues=known_issues,
+            labels=search_labels,
             state='open',
-            extra_labels=ctx_labels,
         )
     )
     if (issues_count := len(open_issues)) > 1:
@@ -325,15 +335,8 @@ def create_or_update_issue(
             f'more than one open issue found for {unique_name_for_element(scanned_element)=}'
         )
     elif issues_count == 0:
-        if extra_labels:
-            extra_labels = set(extra_labels) | set(ctx_labels)
-        else:
-            extra_labels = set(ctx_labels)
-
         return _create_issue(
-            scanned_element=scanned_element,
-            issue_type=issue_type,
-            extra_labels=extra_labels,
+            labels=search_labels | extra_labels,
             repository=repository,
             body=body,
             title=title,
@@ -349,27 +352,22 @@ def create_or_update_issue(
         open_issue: github3.issues.issue.ShortIssue
 
         def labels_to_preserve():
-            nonlocal preserve_labels_regexes
-
             # always keep ctx_labels
             ctx_label_regex = f'{_label_prefix_ctx}.*'
-            preserve_labels_regexes = set(preserve_labels_regexes) | set({ctx_label_regex})
+            preserve_labels_patterns = tuple(
+                re.compile(r) for r in set(preserve_labels_regexes) | {ctx_label_regex}
+            )
 
             for label in open_issue.original_labels:
-                for r in preserve_labels_regexes:
-                    if re.fullmatch(pattern=r, string=label.name):
+                for pattern in preserve_labels_patterns:
+                    if pattern.fullmatch(label.name):
                         yield label.name
                         break
 
-        if extra_labels:
-            extra_labels = set(extra_labels) | set(labels_to_preserve())
-        else:
-            extra_labels = labels_to_preserve()
+        labels = search_labels | extra_labels | frozenset(labels_to_preserve())
         try:
             return _update_issue(
-                scanned_element=scanned_element,
-                issue_type=issue_type,
-                extra_labels=extra_labels,
+                labels=labels,
                 body=body,
                 title=title,
                 assignees=assignees,
@@ -48,7 +48,11 @@ _ctx_label_prefix = github.compliance.issue._label_prefix_ctx
 def _all_issues(
     repository,
 ):
-    return set(repository.issues())
+    # only issues w/ this label are ever considered as known issues (see
+    # github.compliance.issue.enumerate_issues) -> let github filter
+    return set(repository.issues(
+        labels=github.compliance.issue._label_auto_generated,
+    ))
 
 
 def _delivery_dashboard_url(
@@ -99,16 +99,23 @@ def get_component_name_from_reference_name(
     raise ValueError(f'No component reference found {reference_name=}.')
 
 
+_default_title_pattern = re.compile(r'^\[ci:(\S*):(\S*):(\S*)->(\S*)\]$')
+
+
+def _title_pattern(title_regex_pattern: str | None=None) -> re.Pattern:
+    if not title_regex_pattern:
+        return _default_title_pattern
+
+    return re.compile(title_regex_pattern)
+
+
 def parse_pullrequest_title(
     title: str,
     invalid_ok=False,
     title_regex_pattern: str | None=None,
     reference_component: ocm.Component | None=None,
 ) -> ocm.gardener.UpgradeVector | tuple[ocm.gardener.UpgradeVector, str]:
-    if not title_regex_pattern:
-        title_regex_pattern = r'^\[ci:(\S*):(\S*):(\S*)->(\S*)\]$'
-
-    title_pattern = re.compile(title_regex_pattern)
+    title_pattern = _title_pattern(title_regex_pattern)
     if not title_pattern.fullmatch(title):
         if invalid_ok:
             return None
@@ -55,11 +55,11 @@ def find_draft_release(
     # valid.
     max_releases = 1020
     try:
-        for release in repository.releases(number=max_releases):
-            if not release.draft:
-                continue
-            if release.name == name:
-                return release
+        # releases are retrieved page-wise -> stop fetching pages upon first match
+        return next((
+            release for release in repository.releases(number=max_releases)
+            if release.draft and release.name == name
+        ), None)
     except TypeError:
         # `github3.py` raises if one of the release authors is unknown (i.e. a deleted account)
         import traceback
@@ -169,35 +169,23 @@ def outdated_draft_releases(
 
 
 def find_greatest_github_release_version(
-    releases: list[github3.repos.release.Release],
+    releases: typehints.Iterable[github3.repos.release.Release],
     warn_for_unparseable_releases: bool = True,
     ignore_prerelease_versions: bool = False,
 ):
-    # currently, non-draft-releases are not created with a name by us. Use the tag name as fallback
-    release_versions = [
-        release.name if release.name else release.tag_name
-        for release in releases
-    ]
-
-    def filter_non_semver_parseable_releases(release_name):
-        try:
-            version.parse_to_semver(release_name)
-            return True
-        except ValueError:
-            if warn_for_unparseable_releases:
-                logger.warning(f'ignoring release {release_name=} (not semver)')
-            return False
+    def iter_release_version_infos():
+        for release in releases:
+            # currently, non-draft-releases are not created with a name by us. Use the tag name
+            # as fallback
+            release_name = release.name or release.tag_name
+            try:
+                yield version.parse_to_semver(release_name)
+            except ValueError:
+                if warn_for_unparseable_releases:
+                    logger.warning(f'ignoring release {release_name=} (not semver)')
 
-    release_versions = [
-        name for name in filter(filter_non_semver_parseable_releases, release_versions)
-    ]
-
-    release_version_infos = [
-        version.parse_to_semver(release_version)
-        for release_version in release_versions
-    ]
     greatest_version = version.greatest_version(
-        versions=release_version_infos,
+        versions=iter_release_version_infos(),
         ignore_prerelease_versions=ignore_prerelease_versions,
     )
     if greatest_version:
@@ -73,10 +73,20 @@ def mount_default_adapter(
     max_pool_size=32, # requests-library default
     flags=AdapterFlag.CACHE|AdapterFlag.RETRY,
     retry_cfg: Retry=_default_retry_cfg,
+    cache=None,
+    cache_heuristic=None,
 ):
+    '''
+    @param cache: cachecontrol-cache to use (only honoured if CACHE-flag is set)
+    @param cache_heuristic: cachecontrol-heuristic to use (only honoured if CACHE-flag is set)
+    '''
     if AdapterFlag.CACHE in flags:
         import cachecontrol
-        adapter_constructor = cachecontrol.CacheControlAdapter
+        adapter_constructor = functools.partial(
+            cachecontrol.CacheControlAdapter,
+            cache=cache,
+            heuristic=cache_heuristic,
+        )
     else:
         adapter_constructor = HTTPAdapter
 
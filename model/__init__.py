@@ -1,3 +1,4 @@
+import concurrent.futures
 import dataclasses
 import functools
 import json
@@ -229,28 +230,38 @@ class ConfigFactory:
 
         raw[ConfigFactory.CFG_TYPES] = cfg_types_dict
 
+        def parse_cfg_src(cfg_src):
+            if isinstance(cfg_src, LocalFileCfgSrc):
+                return ConfigFactory._parse_local_file(
+                    cfg_dir=cfg_dir,
+                    cfg_src=cfg_src,
+                )
+            elif isinstance(cfg_src, GithubRepoFileSrc):
+                return ConfigFactory._parse_repo_file(
+                    cfg_src=cfg_src,
+                    lookup_cfg_factory=lookup_cfg_factory,
+                )
+            else:
+                raise NotImplementedError(cfg_src)
+
         def retrieve_cfg(cfg_type):
             cfg_dict = {}
 
-            for cfg_src in cfg_type.sources():
-                if cfg_src_types and type(cfg_src) not in cfg_src_types:
-                    continue
-
-                if isinstance(cfg_src, LocalFileCfgSrc):
-                    parsed_cfg = ConfigFactory._parse_local_file(
-                        cfg_dir=cfg_dir,
-                        cfg_src=cfg_src,
-                    )
-                elif isinstance(cfg_src, GithubRepoFileSrc):
-                    if disable_cfg_element_lookup:
-                        continue
-                    parsed_cfg = ConfigFactory._parse_repo_file(
-                        cfg_src=cfg_src,
-                        lookup_cfg_factory=lookup_cfg_factory,
-                    )
-                else:
-                    raise NotImplementedError(cfg_src)
+            cfg_srcs = [
+                cfg_src for cfg_src in cfg_type.sources()
+                if not (cfg_src_types and type(cfg_src) not in cfg_src_types)
+                and not (disable_cfg_element_lookup and isinstance(cfg_src, GithubRepoFileSrc))
+            ]
+
+            if len(cfg_srcs) > 1:
+                # retrieval from github-repositories is i/o-bound -> retrieve concurrently (but
+                # keep order for merging)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                    parsed_cfgs = list(executor.map(parse_cfg_src, cfg_srcs))
+            else:
+                parsed_cfgs = [parse_cfg_src(cfg_src) for cfg_src in cfg_srcs]
 
+            for cfg_src, parsed_cfg in zip(cfg_srcs, parsed_cfgs):
                 if parsed_cfg and parsed_cfg.items():
                     for k,v in parsed_cfg.items():
                         if k in cfg_dict and cfg_dict[k] != v:
@@ -20,6 +20,8 @@ class ConfigElementNotFoundError(ValueError):
 
 
 class ModelValidationMixin:
+    __slots__ = ()
+
     def _required_attributes(self):
         return ()
 
@@ -52,7 +54,8 @@ class ModelValidationMixin:
             )
 
     def _validate_known_attributes(self):
-        unknown_attributes = [a for a in self.raw if a not in self._known_attributes()]
+        known_attributes = self._known_attributes()
+        unknown_attributes = [a for a in self.raw if a not in known_attributes]
         if unknown_attributes:
             if hasattr(self, 'name'):
                 if callable(self.name):
@@ -28,6 +28,11 @@ except ImportError:
 try:
     import yaml
     _have_yaml = True
+    try:
+        # prefer libyaml-backed (C) implementation, if available
+        from yaml import CSafeDumper as _YamlSafeDumper
+    except ImportError:
+        from yaml import SafeDumper as _YamlSafeDumper
 except ImportError:
     _have_yaml = False
     # we will output in JSON-format
@@ -756,9 +761,10 @@ class ComponentDescriptor:
 
 
 if _have_yaml:
-    class EnumValueYamlDumper(yaml.SafeDumper):
+    class EnumValueYamlDumper(_YamlSafeDumper):
         '''
-        a yaml.SafeDumper that will dump enum objects using their values
+        a yaml.SafeDumper (libyaml-backed, if available) that will dump enum objects using their
+        values
         '''
         def represent_data(self, data):
             if isinstance(data, AccessDict):
@@ -778,8 +784,13 @@ class EnumJSONEncoder(json.JSONEncoder):
             # yaml dumper won't know how to parse objects of type `AccessDict`
             # (altough it is just a wrapped dict) -> so convert it to a "real" dict
             o = dict(o)
-        if dataclasses.is_dataclass(o):
-            o = dataclasses.asdict(o)
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            # shallow conversion suffices (encoder will recurse into nested values); this avoids
+            # the (expensive) deep-copying done by `dataclasses.asdict`
+            return {
+                field.name: getattr(o, field.name)
+                for field in dataclasses.fields(o)
+            }
         if isinstance(o, enum.Enum):
             return o.value
         elif isinstance(o, datetime.datetime):
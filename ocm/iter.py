@@ -1,4 +1,5 @@
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
 
@@ -117,6 +118,8 @@ def iter(
     component_filter: collections.abc.Callable[[ocm.Component], bool]=None,
     reftype_filter: collections.abc.Callable[[NodeReferenceType], bool]=None,
     strip_component_descriptor: bool=True,
+    seen_component_ids: set[ocm.ComponentIdentity]=None,
+    max_concurrent_lookups: int=16,
 ) -> collections.abc.Generator[Node, None, None]:
     '''
     returns a generator yielding the transitive closure of nodes accessible from the given component.
@@ -140,116 +143,144 @@ def iter(
                            should be filtered out
     @param strip_component_descriptor: if True, yielded nodes will contain `ocm.Component`.
                                        otherwise, `ocm.ComponentDescriptor`.
+    @param seen_component_ids: optional set of component-ids to consider as already seen (only
+                               honoured if prune_unique is set). Will be updated during iteration;
+                               pass the same set to multiple invocations to emit each component
+                               only once across all of them.
+    @param max_concurrent_lookups: max. amount of referenced component descriptors to lookup
+                                   concurrently (`lookup` must thus be thread-safe)
     '''
     if strip_component_descriptor:
         component = component.component
 
-    seen_component_ids = set()
+    if seen_component_ids is None:
+        seen_component_ids = set()
 
     if not lookup and not recursion_depth == 0:
         raise ValueError('lookup is required if recusion is not disabled (recursion_depth==0)')
 
-    # need to nest actual iterator to keep global state of seen component-IDs
     def inner_iter(
-        component: ocm.Component | ocm.ComponentDescriptor,
-        lookup: ocm.ComponentDescriptorLookup,
-        recursion_depth,
-        path: tuple[NodePathEntry]=(),
-        reftype: NodeReferenceType=NodeReferenceType.COMPONENT_REFERENCE,
+        root_component: ocm.Component | ocm.ComponentDescriptor,
     ):
-        if component_filter and component_filter(component.component):
-            return
-
-        if reftype_filter and reftype_filter(reftype):
-            return
+        # components are traversed depth-first, using an explicit stack (rather than recursion).
+        # referenced components are pushed as pending lookup-results, in reverse order, so they
+        # are traversed in declaration-order
+        stack = [(
+            root_component,
+            recursion_depth,
+            (),
+            NodeReferenceType.COMPONENT_REFERENCE,
+        )]
+
+        while stack:
+            component, remaining_depth, path, reftype = stack.pop()
+
+            if isinstance(component, concurrent.futures.Future):
+                component = component.result()
+
+                if strip_component_descriptor:
+                    component = component.component
+
+            if component_filter and component_filter(component.component):
+                continue
 
-        path = (*path, NodePathEntry(component, reftype))
+            if reftype_filter and reftype_filter(reftype):
+                continue
 
-        yield ComponentNode(
-            path=path,
-        )
+            path = (*path, NodePathEntry(component, reftype))
 
-        for resource in component.component.resources:
-            yield ResourceNode(
+            yield ComponentNode(
                 path=path,
-                resource=resource,
             )
 
-        for source in component.component.sources:
-            yield SourceNode(
-                path=path,
-                source=source,
-            )
-
-        if recursion_depth == 0:
-            return # stop resolving referenced components
-        elif recursion_depth > 0:
-            recursion_depth -= 1
-
-        for cref in component.component.componentReferences:
-            cref_id = ocm.ComponentIdentity(
-                name=cref.componentName,
-                version=cref.version,
-            )
-
-            if ocm_repo:
-                referenced_component_descriptor = lookup(cref_id, ocm_repo)
-            else:
-                referenced_component_descriptor = lookup(cref_id)
-
-            if strip_component_descriptor:
-                referenced_component_descriptor = referenced_component_descriptor.component
-
-            yield from inner_iter(
-                component=referenced_component_descriptor,
-                lookup=lookup,
-                recursion_depth=recursion_depth,
-                path=path,
+            for resource in component.component.resources:
+                yield ResourceNode(
+                    path=path,
+                    resource=resource,
+                )
+
+            for source in component.component.sources:
+                yield SourceNode(
+                    path=path,
+                    source=source,
+                )
+
+            if remaining_depth == 0:
+                continue # stop resolving referenced components
+            elif remaining_depth > 0:
+                remaining_depth -= 1
+
+            referenced_component_ids = [
+                (
+                    ocm.ComponentIdentity(
+                        name=cref.componentName,
+                        version=cref.version,
+                    ),
+                    NodeReferenceType.COMPONENT_REFERENCE,
+                )
+                for cref in component.component.componentReferences
+            ]
+
+            if (extra_crefs_label := component.component.find_label(
+                name=ocm.gardener.ExtraComponentReferencesLabel.name,
+            )):
+                referenced_component_ids.extend(
+                    (
+                        ocm.ComponentIdentity(
+                            name=extra_cref['component_reference']['name'],
+                            version=extra_cref['component_reference']['version'],
+                        ),
+                        NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL,
+                    )
+                    for extra_cref in extra_crefs_label.value
+                )
+
+            # lookups are typically I/O-bound -> retrieve referenced components concurrently
+            lookup_results = [
+                (cached_lookup(cref_id), cref_reftype)
+                for cref_id, cref_reftype in referenced_component_ids
+                if not (reftype_filter and reftype_filter(cref_reftype))
+            ]
+
+            stack.extend(
+                (lookup_result, remaining_depth, path, cref_reftype)
+                for lookup_result, cref_reftype in reversed(lookup_results)
             )
 
-        if not (extra_crefs_label := component.component.find_label(
-            name=ocm.gardener.ExtraComponentReferencesLabel.name,
-        )):
-            return
+    def lookup_component(component_id: ocm.ComponentIdentity):
+        if ocm_repo:
+            return lookup(component_id, ocm_repo)
+        return lookup(component_id)
 
-        for extra_cref in extra_crefs_label.value:
-            extra_cref_id = ocm.ComponentIdentity(
-                name=extra_cref['component_reference']['name'],
-                version=extra_cref['component_reference']['version'],
-            )
+    # components may be referenced through multiple paths; memoise lookups (as futures, so
+    # concurrently pending lookups for the same component are also only issued once)
+    lookup_results: dict[ocm.ComponentIdentity, concurrent.futures.Future] = {}
 
-            if ocm_repo:
-                referenced_component_descriptor = lookup(extra_cref_id, ocm_repo)
-            else:
-                referenced_component_descriptor = lookup(extra_cref_id)
+    def cached_lookup(component_id: ocm.ComponentIdentity) -> concurrent.futures.Future:
+        if (lookup_result := lookup_results.get(component_id)):
+            return lookup_result
 
-            if strip_component_descriptor:
-                referenced_component_descriptor = referenced_component_descriptor.component
+        lookup_result = pool.submit(lookup_component, component_id)
+        lookup_results[component_id] = lookup_result
+        return lookup_result
 
-            yield from inner_iter(
-                component=referenced_component_descriptor,
-                lookup=lookup,
-                recursion_depth=recursion_depth,
-                path=path,
-                reftype=NodeReferenceType.EXTRA_COMPONENT_REFS_LABEL,
-            )
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_lookups)
 
-    for node in inner_iter(
-        component=component,
-        lookup=lookup,
-        recursion_depth=recursion_depth,
-        path=(),
-    ):
-        if node_filter and not node_filter(node):
-            continue
-
-        if prune_unique and isinstance(node, ComponentNode):
-            if node.component.component.identity() in seen_component_ids:
+    try:
+        for node in inner_iter(root_component=component):
+            if node_filter and not node_filter(node):
                 continue
-            else:
-                seen_component_ids.add(node.component_id)
 
-        yield node
+            if prune_unique and isinstance(node, ComponentNode):
+                component_id = node.component_id
+                if component_id in seen_component_ids:
+                    continue
+                seen_component_ids.add(component_id)
+
+            yield node
+    finally:
+        # do not block on pending lookups if iteration is aborted early
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 def iter_resources(
@@ -51,6 +51,33 @@ class ComponentDescriptorOciCfg:
     '''
     componentDescriptorLayer: ComponentDescriptorOciCfgBlobRef
 
+    @staticmethod
+    def from_dict(raw: dict) -> 'ComponentDescriptorOciCfg':
+        '''
+        equivalent to `dacite.from_dict(data_class=ComponentDescriptorOciCfg, data=raw)`. As this
+        is done for each retrieved component-descriptor, the (small and stable) structure is
+        parsed explicitly, avoiding dacite's (costly) per-call type-introspection.
+
+        raises ValueError if passed dict does not match expected structure
+        '''
+        try:
+            layer = raw['componentDescriptorLayer']
+            layer_ref = ComponentDescriptorOciCfgBlobRef(
+                digest=layer['digest'],
+                mediaType=layer.get('mediaType', component_descriptor_cfg_mimetype),
+                size=layer['size'],
+                annotations=layer.get('annotations'),
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f'not a valid component-descriptor-oci-cfg: {raw=}') from e
+
+        if not isinstance(layer_ref.digest, str) or not isinstance(layer_ref.size, int):
+            raise ValueError(f'not a valid component-descriptor-oci-cfg: {raw=}')
+
+        return ComponentDescriptorOciCfg(
+            componentDescriptorLayer=layer_ref,
+        )
+
 
 def component_descriptor_to_tarfileobj(
     component_descriptor: typing.Union[dict, ocm.ComponentDescriptor],
@@ -0,0 +1,75 @@
+import cnudie.iter
+import ocm
+
+
+def component(
+    name: str,
+    references: tuple[str, ...]=(),
+) -> ocm.Component:
+    return ocm.Component(
+        name=name,
+        version='1.2.3',
+        repositoryContexts=[],
+        provider='acme',
+        sources=[],
+        resources=[
+            ocm.Resource(
+                name=f'{name}-resource',
+                version='1.2.3',
+                type=ocm.ArtefactType.OCI_IMAGE,
+                access=None,
+            ),
+        ],
+        componentReferences=[
+            ocm.ComponentReference(
+                name=reference,
+                componentName=reference,
+                version='1.2.3',
+            ) for reference in references
+        ],
+    )
+
+
+def test_iter_depth_limited_diamond():
+    # root -> a -> c -> d
+    # root -> c
+    components = {
+        c.name: c for c in (
+            component('root', references=('a', 'c')),
+            component('a', references=('c',)),
+            component('c', references=('d',)),
+            component('d'),
+        )
+    }
+
+    def lookup(component_id: ocm.ComponentIdentity, /):
+        return ocm.ComponentDescriptor(
+            meta=ocm.Metadata(),
+            component=components[component_id.name],
+            signatures=[],
+        )
+
+    nodes = tuple(cnudie.iter.iter(
+        component=components['root'],
+        lookup=lookup,
+        recursion_depth=2,
+    ))
+
+    component_paths = [
+        tuple(entry.component.name for entry in node.path)
+        for node in nodes
+        if isinstance(node, cnudie.iter.ComponentNode)
+    ]
+    # each component is emitted exactly once
+    assert len(component_paths) == len(components)
+    # c is first reached via a (w/o remaining depth); d must still be reached via root -> c
+    assert ('root', 'a', 'c') in component_paths
+    assert ('root', 'c', 'd') in component_paths
+    assert ('root', 'c') not in component_paths
+    assert ('root', 'a', 'c', 'd') not in component_paths
+
+    resource_names = [
+        node.resource.name for node in nodes
+        if isinstance(node, cnudie.iter.ResourceNode)
+    ]
+    assert sorted(resource_names) == sorted(f'{name}-resource' for name in components)
@@ -0,0 +1,142 @@
+import dataclasses
+import os
+
+import yaml
+
+import cnudie.retrieve
+import cnudie.util
+import ocm
+
+
+def component_descriptor(
+    name: str='acme.org/example',
+    version: str='1.2.3',
+    ocm_repo_url: str='registry.acme.org/ocm',
+) -> ocm.ComponentDescriptor:
+    return ocm.ComponentDescriptor(
+        meta=ocm.Metadata(),
+        component=ocm.Component(
+            name=name,
+            version=version,
+            repositoryContexts=[
+                ocm.OciOcmRepository(baseUrl=ocm_repo_url),
+            ],
+            provider='acme',
+            sources=[],
+            resources=[],
+            componentReferences=[],
+        ),
+        signatures=[],
+    )
+
+
+def test_composite_lookup_promotes_file_system_cache_hits(tmp_path):
+    cd = component_descriptor()
+    component_id = cnudie.util.to_component_id(cd)
+    ocm_repository_lookup = cnudie.retrieve.ocm_repository_lookup('registry.acme.org/ocm')
+
+    in_memory_lookup = cnudie.retrieve.in_memory_cache_component_descriptor_lookup(
+        ocm_repository_lookup=ocm_repository_lookup,
+    )
+    fs_lookup = cnudie.retrieve.file_system_cache_component_descriptor_lookup(
+        cache_dir=str(tmp_path),
+        ocm_repository_lookup=ocm_repository_lookup,
+    )
+
+    # fill file-system cache only
+    writeback = fs_lookup(component_id)
+    assert isinstance(writeback, cnudie.retrieve.WriteBack)
+    writeback(component_id, cd)
+
+    assert isinstance(in_memory_lookup(component_id), cnudie.retrieve.WriteBack)
+
+    composite_lookup = cnudie.retrieve.composite_component_descriptor_lookup(
+        lookups=(in_memory_lookup, fs_lookup),
+        ocm_repository_lookup=ocm_repository_lookup,
+    )
+
+    assert composite_lookup(component_id) == cd
+    # hit from file-system cache must have been written back to in-memory cache
+    assert in_memory_lookup(component_id) == cd
+
+
+def test_file_system_cache_roundtrip(tmp_path):
+    cd = component_descriptor()
+    component_id = cnudie.util.to_component_id(cd)
+    ocm_repo = cd.component.current_ocm_repo
+
+    fs_lookup = cnudie.retrieve.file_system_cache_component_descriptor_lookup(
+        cache_dir=str(tmp_path),
+        ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup('registry.acme.org/ocm'),
+    )
+    writeback = fs_lookup(component_id)
+    writeback(component_id, cd)
+
+    assert cnudie.retrieve.read_from_file_system_cache(
+        cache_dir=str(tmp_path),
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+    ) == cd
+    assert fs_lookup(component_id) == cd
+
+
+def test_file_system_cache_reads_legacy_yaml(tmp_path):
+    cd = component_descriptor()
+    component_id = cnudie.util.to_component_id(cd)
+    ocm_repo = cd.component.current_ocm_repo
+
+    # previous versions stored descriptors as YAML (w/o file-suffix)
+    legacy_path = cnudie.retrieve.file_system_cache_path(
+        cache_dir=str(tmp_path),
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+        suffix='',
+    )
+    os.makedirs(os.path.dirname(legacy_path))
+    with open(legacy_path, 'w') as f:
+        yaml.dump(
+            data=dataclasses.asdict(cd),
+            Dumper=ocm.EnumValueYamlDumper,
+            stream=f,
+        )
+
+    assert cnudie.retrieve.read_from_file_system_cache(
+        cache_dir=str(tmp_path),
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+    ) == cd
+
+
+def test_file_system_cache_indexed_file_removed(tmp_path):
+    cd = component_descriptor()
+    component_id = cnudie.util.to_component_id(cd)
+    ocm_repo = cd.component.current_ocm_repo
+
+    fs_lookup = cnudie.retrieve.file_system_cache_component_descriptor_lookup(
+        cache_dir=str(tmp_path),
+        ocm_repository_lookup=cnudie.retrieve.ocm_repository_lookup('registry.acme.org/ocm'),
+    )
+    fs_lookup(component_id)(component_id, cd)
+
+    dir_index = {}
+    assert cnudie.retrieve.read_from_file_system_cache(
+        cache_dir=str(tmp_path),
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+        dir_index=dir_index,
+    ) == cd
+
+    # removed after directory-entries were indexed -> cache-miss
+    os.remove(cnudie.retrieve.file_system_cache_path(
+        cache_dir=str(tmp_path),
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+    ))
+
+    assert cnudie.retrieve.read_from_file_system_cache(
+        cache_dir=str(tmp_path),
+        ocm_repo=ocm_repo,
+        component_id=component_id,
+        dir_index=dir_index,
+    ) is None
+    assert not any(dir_index.values())
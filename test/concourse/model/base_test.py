@@ -0,0 +1,22 @@
+import concourse.model.base as examinee
+
+AttributeSpec = examinee.AttributeSpec
+RequiredPolicy = examinee.RequiredPolicy
+
+
+ATTRIBUTES = (
+    AttributeSpec.required(name='a', doc='doc-a'),
+    AttributeSpec.optional(name='b', doc='b', default='x'),
+    AttributeSpec.deprecated(name='c', doc='c'),
+)
+
+
+def test_filter_attrs():
+    assert tuple(AttributeSpec.filter_attrs(ATTRIBUTES, required=None)) == ATTRIBUTES
+    assert tuple(AttributeSpec.filter_attrs(ATTRIBUTES, required=RequiredPolicy.OPTIONAL)) \
+        == (ATTRIBUTES[1],)
+
+
+def test_select_attr():
+    assert examinee.select_attr('doc')(ATTRIBUTES[0]) == 'doc-a'
+    assert tuple(map(examinee.select_attr('default'), ATTRIBUTES)) == (None, 'x', None)
@@ -0,0 +1,50 @@
+import pytest
+
+import concourse.model.traits.update_component_deps as examinee
+
+MergePolicy = examinee.MergePolicy
+
+
+def merge_policy_config(
+    component_names: list[str],
+    merge_mode: str='manual',
+) -> examinee.MergePolicyConfig:
+    return examinee.MergePolicyConfig({
+        'component_names': component_names,
+        'merge_mode': merge_mode,
+    })
+
+
+@pytest.mark.parametrize('fallback_pattern', ('x|y', '(x|y)')) # latter cannot be combined
+def test_merge_policies_find_policy(fallback_pattern):
+    merge_policies = examinee.MergePolicies([
+        merge_policy_config(['acme.org/.*', 'foo']),
+        merge_policy_config([fallback_pattern], merge_mode='auto_merge'),
+        merge_policy_config(['x', 'bar']),
+    ])
+
+    assert merge_policies.merge_policy_for('acme.org/foo') is MergePolicy.MANUAL
+    assert merge_policies.merge_policy_for('foo') is MergePolicy.MANUAL
+    # first matching policy wins
+    assert merge_policies.merge_policy_for('x') is MergePolicy.AUTO_MERGE
+    assert merge_policies.merge_policy_for('bar') is MergePolicy.MANUAL
+    # patterns must match completely
+    assert merge_policies.merge_policy_for('foobar') is None
+    assert merge_policies.merge_policy_for('xy') is None
+
+
+def test_merge_policies_find_policy_literal_names():
+    manual_policy = merge_policy_config(['foo', 'bar'])
+    auto_merge_policy = merge_policy_config(['baz', '.*'], merge_mode='auto_merge')
+    merge_policies = examinee.MergePolicies([
+        manual_policy,
+        auto_merge_policy,
+        merge_policy_config(['qux']), # unreachable
+    ])
+
+    assert merge_policies.find_policy('foo') is manual_policy
+    assert merge_policies.find_policy('baz') is auto_merge_policy
+    assert merge_policies.find_policy('qux') is auto_merge_policy
+
+    merge_policies = examinee.MergePolicies([manual_policy])
+    assert merge_policies.find_policy('foobar') is None
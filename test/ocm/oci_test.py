@@ -0,0 +1,42 @@
+import dacite
+import pytest
+
+import ocm.oci
+
+
+def test_component_descriptor_oci_cfg_from_dict():
+    raw = {
+        'componentDescriptorLayer': {
+            'digest': 'sha256:abc',
+            'mediaType': 'application/vnd.gardener.cloud.cnudie.component-descriptor.v2+yaml+tar',
+            'size': 42,
+        },
+    }
+
+    cfg = ocm.oci.ComponentDescriptorOciCfg.from_dict(raw)
+
+    assert cfg == dacite.from_dict(
+        data_class=ocm.oci.ComponentDescriptorOciCfg,
+        data=raw,
+    )
+    assert cfg.componentDescriptorLayer.digest == 'sha256:abc'
+    assert cfg.componentDescriptorLayer.size == 42
+
+    # mediaType is optional
+    del raw['componentDescriptorLayer']['mediaType']
+    cfg = ocm.oci.ComponentDescriptorOciCfg.from_dict(raw)
+    assert cfg.componentDescriptorLayer.mediaType == ocm.oci.component_descriptor_cfg_mimetype
+
+
+@pytest.mark.parametrize('raw', (
+    {},
+    {'componentDescriptorLayer': None},
+    {'componentDescriptorLayer': {'size': 42}}, # missing digest
+    {'componentDescriptorLayer': {'digest': 'sha256:abc'}}, # missing size
+    {'componentDescriptorLayer': {'digest': 42, 'size': 42}},
+    {'componentDescriptorLayer': {'digest': 'sha256:abc', 'size': '42'}},
+    [],
+))
+def test_component_descriptor_oci_cfg_from_dict_malformed(raw):
+    with pytest.raises(ValueError):
+        ocm.oci.ComponentDescriptorOciCfg.from_dict(raw)
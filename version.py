@@ -6,6 +6,7 @@
 import collections
 import dataclasses
 import enum
+import functools
 import logging
 import semver
 
@@ -180,7 +181,10 @@ def parse_to_semver(
     return semver_version_info
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_to_semver_and_prefix(version: str) -> tuple[semver.VersionInfo, str | None]:
+    # memoised, as same versions (e.g. tags) are typically parsed repeatedly; this is safe, as
+    # semver.VersionInfo is immutable
     def raise_invalid():
         raise ValueError(f'not a valid (semver) version: `{version}`')
 
@@ -193,8 +193,8 @@ class GithubWebhookDispatcher:
         for descriptor in definition_descriptors:
             # need to merge and consider the effective definition
             effective_definition = descriptor.pipeline_definition
-            for override in descriptor.override_definitions:
-                effective_definition = ci.util.merge_dicts(effective_definition, override)
+            if (overrides := [o for o in descriptor.override_definitions if o]):
+                effective_definition = ci.util.merge_dicts(effective_definition, *overrides)
 
             yield Pipeline(
                 pipeline_name=descriptor.effective_pipeline_name(),